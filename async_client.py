@@ -1,12 +1,174 @@
 import asyncio
+import contextlib
+import functools
+import logging
+import shelve
 import socket
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable, List
 import urllib.parse
 import json
 import time
 
+# Fields requested for every ANIME query
+ANIME_AMASK = b'b2f0e401070000'
+
+# Minimum seconds between two commands (AniDB flood protection)
+COMMAND_INTERVAL = 2
+
+# Slowest pacing after repeated 602 SERVER BUSY replies
+MAX_COMMAND_INTERVAL = 30
+
+# Maximum number of commands waiting for a reply at the same time
+MAX_IN_FLIGHT = 4
+
+# Kernel send/receive buffer size for the UDP socket
+SOCKET_BUFFER_SIZE = 1 << 20
+
+# Seconds logout_now() may block on its socket at application exit
+LOGOUT_TIMEOUT = 1
+
+# 501 LOGIN FIRST / 506 INVALID SESSION
+SESSION_EXPIRED_CODES = (b'501', b'506')
+
+# 602 SERVER BUSY: AniDB asks the client to send less
+SERVER_BUSY_CODE = b'602'
+
+# Local cache of ANIME replies, entries older than CACHE_MAX_AGE seconds are queried again
+CACHE_FILE = 'anidb_cache.db'
+CACHE_MAX_AGE = 7 * 86400
+
+# AUTH reply codes: (accepted, log message)
+AUTH_RESPONSES = {
+    b'200': (True, "Authentication successful"),
+    b'201': (True, "Authentication successful, a new client version is available"),
+    b'500': (False, "Authentication failed: wrong username or password"),
+    b'503': (False, "Authentication failed: client version outdated"),
+    b'504': (False, "Authentication failed: client banned"),
+    b'505': (False, "Authentication failed: illegal input or access denied"),
+    b'601': (False, "Authentication failed: AniDB out of service"),
+}
+
+@functools.lru_cache(maxsize=4096)
+def _quote_name(name: str) -> bytes:
+    """URL-quote an anime name for the ANIME command, memoized for re-scans."""
+    # Encode once and quote the raw bytes, '/' and '&' must not reach the command unquoted
+    return urllib.parse.quote_from_bytes(name.encode('utf-8'), safe=b'').encode('ascii')
+
+def _int_field(value: bytes) -> int:
+    """Convert a numeric response field, empty or non-numeric fields become 0."""
+    return int(value) if value.isdigit() else 0
+
+def _text_field(value: bytes) -> str:
+    """Decode a text response field."""
+    return value.decode('utf-8')
+
+class TokenBucket:
+    """
+    Async token bucket rate limiter.
+
+    Waiters sleep outside the lock, so a coroutine waiting for a token does
+    not block others from checking the bucket.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1, min_rate: Optional[float] = None):
+        self.rate = rate
+        self.base_rate = rate
+        self.min_rate = min_rate if min_rate is not None else rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.timestamp = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def reset_lock(self):
+        """Create a new lock for the running event loop, the token count is kept."""
+        self._lock = asyncio.Lock()
+
+    def slow_down(self):
+        """Halve the rate, but not below min_rate."""
+        self._refill()
+        self.rate = max(self.rate / 2, self.min_rate)
+
+    def reset_rate(self):
+        """Go back to the rate the bucket was created with."""
+        self._refill()
+        self.rate = self.base_rate
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.timestamp) * self.rate)
+        self.timestamp = now
+
+    async def acquire(self):
+        """Wait until a token is available and take it."""
+        while True:
+            async with self._lock:
+                self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            await asyncio.sleep(wait)
+
+class AniDBProtocol(asyncio.DatagramProtocol):
+    """Routes tagged AniDB replies to the coroutine waiting for them."""
+
+    def __init__(self, logger):
+        self.logger = logger
+        self.pending: Dict[bytes, asyncio.Future] = {}
+
+    def datagram_received(self, data: bytes, addr):
+        # Tagged replies look like "{tag} {code} {message}"
+        tag, _, reply = data.partition(b' ')
+        future = self.pending.pop(tag, None)
+        if future is None or future.done():
+            self.logger.debug("Dropping reply without waiting request: %r", data[:50])
+            return
+        future.set_result(reply)
+
+    def error_received(self, exc):
+        self.logger.warning("UDP error from AniDB socket: %s", exc)
+        # The error carries no tag, fail only the oldest in-flight command so its
+        # sender retries right away; the others still wait for their own reply
+        for tag, future in self.pending.items():
+            if not future.done():
+                del self.pending[tag]
+                future.set_exception(exc)
+                break
+
+    def connection_lost(self, exc):
+        for future in self.pending.values():
+            if not future.done():
+                future.set_exception(exc or ConnectionError("AniDB socket closed"))
+        self.pending.clear()
+
 class AsyncAniDBClient:
-    def __init__(self, credentials: dict, logger, max_retries: int = 3):
+    __slots__ = (
+        'credentials', 'logger', 'session_key', '_query_suffix', 'transport', 'protocol',
+        '_cache', '_inflight', 'server', 'port', 'max_retries', 'timeout', '_tag_counter',
+        '_bucket', '_auth_command', '_auth_debug', '_local_port', '_slots',
+        '_server_addr', '_auth_lock',
+    )
+
+    # (result key, position in the ANIME reply, converter) for ANIME_AMASK
+    _ANIME_FIELDS = (
+        ('aid', 0, int),
+        ('year', 1, _text_field),
+        ('type', 2, _text_field),
+        ('romaji', 4, _text_field),
+        ('kanji', 5, _text_field),
+        ('english', 6, _text_field),
+        ('synonyms', 7, _text_field),
+        ('episodes', 8, _int_field),
+        ('ep_count', 9, _int_field),
+        ('special_count', 10, _int_field),
+        ('tag_name_list', 11, _text_field),
+        ('tag_id_list', 13, _text_field),
+        ('tag_weigth_list', 14, _text_field),
+    )
+    _ANIME_FIELD_COUNT = max(index for _, index, _ in _ANIME_FIELDS) + 1
+
+    def __init__(self, credentials: dict, logger, max_retries: int = 3,
+                 command_interval: float = COMMAND_INTERVAL):
         if not isinstance(credentials, dict):
             raise ValueError("Credentials must be a dictionary")
         if 'username' not in credentials or 'password' not in credentials:
@@ -15,99 +177,225 @@ class AsyncAniDBClient:
         self.credentials = credentials
         self.logger = logger
         self.session_key: Optional[str] = None
-        self.socket = None
+        self._query_suffix: Optional[bytes] = None
+        self.transport: Optional[asyncio.DatagramTransport] = None
+        self.protocol: Optional[AniDBProtocol] = None
+        self._cache: Optional[shelve.Shelf] = None
+        # Queries currently on the wire, keyed like the cache
+        self._inflight: Dict[str, asyncio.Future] = {}
         self.server = 'api.anidb.net'
         self.port = 9000
         self.max_retries = max_retries
-        self.timeout_count = 0
-        self.last_command_time = 0
+        self.timeout = 10
+        self._tag_counter = 0
+        # AniDB allows one command every COMMAND_INTERVAL seconds, a configured
+        # interval can only be slower; 602 replies slow down to MAX_COMMAND_INTERVAL
+        command_interval = min(max(command_interval, COMMAND_INTERVAL), MAX_COMMAND_INTERVAL)
+        self._bucket = TokenBucket(rate=1 / command_interval, min_rate=1 / MAX_COMMAND_INTERVAL)
+        # Limits the commands waiting for a reply, created in open() for the running loop
+        self._slots: Optional[asyncio.Semaphore] = None
+        # Local UDP port of the last open(), AniDB ties the session to it
+        self._local_port: Optional[int] = None
+        # Resolved address of the server, looked up on the first open()
+        self._server_addr: Optional[tuple] = None
+        # Serializes re-logins of concurrent queries, created in open() for the running loop
+        self._auth_lock: Optional[asyncio.Lock] = None
+        # The AUTH command never changes for a client, build it once
+        auth_template = "AUTH user={username}&pass={password}&protover=3&client=lewdwatcher&clientver=1"
+        self._auth_command = auth_template.format(
+            username=credentials['username'], password=credentials['password']
+        ).encode('utf-8')
+        # Log command (the password is never put into this string)
+        self._auth_debug = auth_template.format(username=credentials['username'], password='********')
         self.logger.info("AsyncAniDBClient initialized")
-        self.logger.debug(f"Initialized with username: {credentials['username']}")
-
-    def _check_rate_limit(self):
-        """Ensure we don't exceed API rate limits"""
-        current_time = time.time()
-        time_since_last = current_time - self.last_command_time
-        if time_since_last < 2:
-            time.sleep(2 - time_since_last)
-        self.last_command_time = time.time()
-
-    def _handle_timeout(self):
-        """Handle timeout and check if we should continue"""
-        self.timeout_count += 1
-        if self.timeout_count >= self.max_retries:
+        self.logger.debug("Initialized with username: %s", credentials['username'])
+
+    async def _handle_timeout(self, timeouts: int):
+        """Handle the given number of timeouts of one command and check if we should continue"""
+        if timeouts >= self.max_retries:
             self.logger.error(f"Maximum number of retries ({self.max_retries}) reached")
             raise Exception("Maximum number of timeouts reached")
-        self.logger.warning(f"Timeout {self.timeout_count}/{self.max_retries}")
-        time.sleep(2 * self.timeout_count)  # Exponential backoff
+        self.logger.warning(f"Timeout {timeouts}/{self.max_retries}")
+        await asyncio.sleep(2 * timeouts)  # Exponential backoff
 
-    async def send_command(self, command: bytes, expect_response: bool = True) -> Optional[str]:
+    async def send_command(self, command: bytes, expect_response: bool = True) -> Optional[bytes]:
         """Send command with retry logic"""
-        self._check_rate_limit()
-        
-        for attempt in range(self.max_retries):
-            try:
-                self.socket.sendto(command, (self.server, self.port))
-                
-                if expect_response:
-                    # Convert blocking socket operations to async
-                    loop = asyncio.get_event_loop()
-                    data, _ = await loop.run_in_executor(
-                        None, 
-                        lambda: self.socket.recvfrom(1024)
-                    )
-                    self.timeout_count = 0  # Reset on successful response
-                    return data.decode('utf-8')
-                return None
-                
-            except socket.timeout:
-                self._handle_timeout()
-                if attempt < self.max_retries - 1:
-                    self.logger.info(f"Retrying command (attempt {attempt + 2}/{self.max_retries})")
-                    await asyncio.sleep(2 * (attempt + 1))  # Use async sleep
-                    continue
-                raise
+        # At most MAX_IN_FLIGHT commands on the wire, however many callers there are
+        async with self._slots:
+            # Timeouts count per command, other commands in flight do not share them
+            timeouts = 0
+            for attempt in range(self.max_retries):
+                # Every packet, including retries, counts against the rate limit
+                await self._bucket.acquire()
+
+                if not expect_response:
+                    self.transport.sendto(command)
+                    return None
+
+                # Every attempt gets its own tag so a late reply cannot answer a retry
+                self._tag_counter += 1
+                tag = b't%d' % self._tag_counter
+                future = asyncio.get_running_loop().create_future()
+                self.protocol.pending[tag] = future
+                try:
+                    self.transport.sendto(command + b'&tag=' + tag)
+                    reply = await asyncio.wait_for(future, timeout=self.timeout)
+
+                    if reply[:3] == SERVER_BUSY_CODE and attempt < self.max_retries - 1:
+                        # Slow down every following command, not only this retry
+                        self._bucket.slow_down()
+                        self.logger.warning(
+                            f"AniDB server busy, sending one command every {1 / self._bucket.rate:.1f}s"
+                        )
+                        continue
+                    return reply  # Decoded by the handlers, only where text is needed
+
+                except (socket.timeout, asyncio.TimeoutError):
+                    timeouts += 1
+                    await self._handle_timeout(timeouts)
+                    if attempt < self.max_retries - 1:
+                        self.logger.info(f"Retrying command (attempt {attempt + 2}/{self.max_retries})")
+                        continue
+                    raise
+                except OSError as e:
+                    # Socket errors only count against this command, like its timeouts
+                    if attempt < self.max_retries - 1:
+                        self.logger.info("Retrying command after socket error: %s (attempt %d/%d)",
+                                         e, attempt + 2, self.max_retries)
+                        continue
+                    raise
+                finally:
+                    self.protocol.pending.pop(tag, None)
+
+    async def open(self):
+        """
+        Open the UDP endpoint on the running event loop.
+
+        An existing session key is reused, so reopening the client for a new
+        scan does not cost another AUTH round trip. The socket is bound to the
+        local port of the previous open(), because AniDB only accepts a session
+        from the address it was created on. AniDB answers a stale key with
+        501/506, which query_anime() handles by logging in again.
+        """
+        sock = None
+        try:
+            loop = asyncio.get_running_loop()
+            if self._cache is None:
+                self._cache = shelve.open(CACHE_FILE)
+            # Each asyncio.run() of a worker is a new event loop
+            self._bucket.reset_lock()
+            self._bucket.reset_rate()
+            self._slots = asyncio.Semaphore(MAX_IN_FLIGHT)
+            self._auth_lock = asyncio.Lock()
+            # Create UDP socket
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            sock.setblocking(False)
+            # Room for bursts of replies while queries are in flight
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER_SIZE)
+            if hasattr(socket, 'IP_RECVERR'):
+                # Linux: report ICMP errors (e.g. port unreachable) on the socket
+                sock.setsockopt(socket.IPPROTO_IP, socket.IP_RECVERR, 1)
+            if self._local_port:
+                try:
+                    sock.bind(('', self._local_port))
+                except OSError as e:
+                    # Port taken, a new port means the session is logged in again
+                    self.logger.warning(f"Could not reuse local port {self._local_port}: {str(e)}")
+            # Resolve the server once per client and fix the peer address for send/recv
+            if self._server_addr is None:
+                infos = await loop.getaddrinfo(
+                    self.server, self.port, family=socket.AF_INET, type=socket.SOCK_DGRAM
+                )
+                self._server_addr = infos[0][4]
+            await loop.sock_connect(sock, self._server_addr)
+            self._local_port = sock.getsockname()[1]
+            # Replies are delivered by the event loop to AniDBProtocol
+            self.transport, self.protocol = await loop.create_datagram_endpoint(
+                lambda: AniDBProtocol(self.logger), sock=sock
+            )
+            if not self.session_key:
+                await self.authenticate()
+            else:
+                self.logger.info("Reusing existing AniDB session")
+        except Exception:
+            if self.transport:
+                self.transport.close()
+                self.transport = None
+            elif sock:
+                sock.close()
+            self._close_cache()
+            # Look the server up again next time, its address may have changed
+            self._server_addr = None
+            raise
+
+    async def close(self, logout: bool = True):
+        """
+        Close the UDP endpoint.
+
+        Parameters
+        ----------
+        logout : bool
+            End the AniDB session as well. Pass False to keep the session key
+            for the next open().
+        """
+        if self.transport:
+            if logout:
+                await self.logout()
+            self.transport.close()
+            self.transport = None
+            self.protocol = None
+            self.logger.info("Socket closed successfully")
+        self._close_cache()
+
+    def _close_cache(self):
+        if self._cache is not None:
+            self._cache.close()
+            self._cache = None
 
     async def __aenter__(self):
         self.logger.debug("Entering context manager")
         try:
-            # Create UDP socket
-            self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            self.socket.settimeout(10)  # 10 seconds timeout
-            await self.authenticate()
+            await self.open()
             return self
         except Exception as e:
             self.logger.error(f"Error in context manager entry: {str(e)}")
-            if self.socket:
-                self.socket.close()
             raise
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         self.logger.debug("Exiting context manager")
         try:
-            if self.socket:
-                await self.logout()
-                self.socket.close()
-                self.logger.info("Socket closed successfully")
+            await self.close()
         except Exception as e:
             self.logger.error(f"Error during context manager exit: {str(e)}")
 
+    @contextlib.asynccontextmanager
+    async def session(self, logout: bool = True):
+        """
+        Open the client for one block, like ``async with client``.
+
+        Parameters
+        ----------
+        logout : bool
+            End the AniDB session when the block is left. Pass False for a
+            client that is reused, the next block then skips the AUTH.
+        """
+        await self.open()
+        try:
+            yield self
+        finally:
+            try:
+                await self.close(logout=logout)
+            except Exception as e:
+                self.logger.error(f"Error closing AniDB client: {str(e)}")
+
     async def authenticate(self):
         self.logger.info("Starting authentication process")
         try:
-            auth_command = (
-                f"AUTH user={self.credentials['username']}&"
-                f"pass={self.credentials['password']}&"
-                "protover=3&"
-                "client=lewdwatcher&"
-                "clientver=1"
-            ).encode('utf-8')
-
-            # Log command (without password)
-            safe_command = auth_command.decode('utf-8').replace(self.credentials['password'], '********')
-            self.logger.debug(f"Sending auth command: {safe_command}")
-
-            response = await self.send_command(auth_command)
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Sending auth command: %s", self._auth_debug)
+
+            response = await self.send_command(self._auth_command)
             if not response:
                 raise ValueError("No response from server")
             
@@ -115,9 +403,12 @@ class AsyncAniDBClient:
             if not self.session_key:
                 raise ValueError("Authentication failed")
 
+            # amask and session key stay the same for every query of this session
+            self._query_suffix = b'&amask=' + ANIME_AMASK + b'&s=' + self.session_key.encode('ascii')
+
             return True
 
-        except socket.timeout:
+        except (socket.timeout, asyncio.TimeoutError):
             self.logger.error("Final authentication timeout")
             raise
         except Exception as e:
@@ -125,33 +416,102 @@ class AsyncAniDBClient:
             raise
 
     async def query_anime(self, query: str, by_id: bool = False) -> Optional[Dict[str, Any]]:
+        cache_key = f"{int(by_id)}:{query}"
+        if self._cache is not None:
+            cached = self._cache.get(cache_key)
+            if cached and time.time() - cached[0] < CACHE_MAX_AGE:
+                self.logger.debug("Cache hit for anime query: %s", cache_key)
+                return cached[1]
+
+        pending = self._inflight.get(cache_key)
+        if pending is not None:
+            # Same query already running: wait for its reply instead of sending another
+            self.logger.debug("Joining in-flight anime query: %s", cache_key)
+            return await asyncio.shield(pending)
+
         if not self.session_key:
             raise ValueError("Not authenticated")
 
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = future
+        try:
+            result = await self._fetch_anime(query, by_id, cache_key)
+            future.set_result(result)
+            return result
+        finally:
+            if not future.done():
+                future.set_result(None)
+            self._inflight.pop(cache_key, None)
+
+    async def _fetch_anime(self, query: str, by_id: bool, cache_key: str) -> Optional[Dict[str, Any]]:
         try:
             # Prepare command
             if by_id:
-                command = f"ANIME aid={query}&"
+                command = b'ANIME aid=' + str(query).encode('ascii')
             else:
-                command = f"ANIME aname={urllib.parse.quote(query)}&"
+                command = b'ANIME aname=' + _quote_name(query)
             
-            command += f"amask=b2f0e401070000&s={self.session_key}"
+            self.logger.debug("Sending anime query: %s", command)
             
-            self.logger.debug(f"Sending anime query: {command}")
-            
-            response = await self.send_command(command.encode('utf-8'))
+            session_key = self.session_key
+            response = await self.send_command(command + self._query_suffix)
+            if response and response[:3] in SESSION_EXPIRED_CODES:
+                # Session timed out on the server: log in again once and retry
+                await self._reauthenticate(session_key, response[:3])
+                response = await self.send_command(command + self._query_suffix)
+
             if not response:
                 return None
                 
-            return self._process_anime_response(response)
+            result = self._process_anime_response(response)
+            if result and self._cache is not None:
+                self._cache[cache_key] = (time.time(), result)
+            return result
 
-        except socket.timeout:
+        except (socket.timeout, asyncio.TimeoutError):
             self.logger.error("Final query timeout")
             return None
         except Exception as e:
             self.logger.error(f"Query error: {str(e)}")
             return None
 
+    async def _reauthenticate(self, stale_key: Optional[str], code: bytes):
+        """
+        Log in again after AniDB rejected ``stale_key``.
+
+        Concurrent queries that failed with the same key share one AUTH: the
+        first one logs in, the others find a new key once they get the lock.
+        """
+        async with self._auth_lock:
+            if self.session_key != stale_key:
+                return
+            self.logger.warning("Session rejected (%s), re-authenticating", code.decode('ascii'))
+            await self.authenticate()
+
+    async def query_many(self, queries: Iterable[str], by_id: bool = False) -> List[Optional[Dict[str, Any]]]:
+        """
+        Query several anime over the current session.
+
+        Parameters
+        ----------
+        queries : Iterable[str]
+            Anime names (or AniDB IDs if ``by_id`` is set)
+        by_id : bool
+            Treat the queries as AniDB IDs
+
+        Returns
+        -------
+        List[Optional[Dict[str, Any]]]
+            Results in the same order as ``queries``, None for failed lookups
+        """
+        queries = list(queries)
+        self.logger.info(f"Querying {len(queries)} anime")
+
+        # Tagged commands let several queries wait for their reply at once;
+        # send_command() limits them to MAX_IN_FLIGHT and the token bucket
+        # still spaces out the sends.
+        return list(await asyncio.gather(*(self.query_anime(query, by_id=by_id) for query in queries)))
+
     async def logout(self):
         if self.session_key:
             try:
@@ -160,62 +520,92 @@ class AsyncAniDBClient:
                 self.logger.info("Logout command sent")
             except Exception as e:
                 self.logger.warning(f"Error during logout: {str(e)}")
+            finally:
+                self.session_key = None
+                self._query_suffix = None
+
+    def logout_now(self):
+        """
+        Send LOGOUT from a plain blocking socket, without an event loop.
 
-    def _handle_auth_response(self, response: str) -> Optional[str]:
+        Meant for application exit: no cache is opened, no rate-limit token
+        is waited for and no reply is expected. The datagram is sent from the
+        local port of the session, so AniDB can match it. Does nothing if the
+        client never reached the server.
+        """
+        if not self.session_key:
+            return
+        try:
+            if self._server_addr is None:
+                self.logger.debug("Server address unknown, not sending LOGOUT")
+                return
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+                sock.settimeout(LOGOUT_TIMEOUT)
+                if self._local_port:
+                    try:
+                        sock.bind(('', self._local_port))
+                    except OSError as e:
+                        self.logger.debug("Could not reuse local port %s for LOGOUT: %s", self._local_port, e)
+                sock.sendto(b'LOGOUT s=' + self.session_key.encode('ascii'), self._server_addr)
+            self.logger.info("Logout command sent")
+        except OSError as e:
+            self.logger.warning(f"Error during logout: {str(e)}")
+        finally:
+            self.session_key = None
+            self._query_suffix = None
+
+    def _handle_auth_response(self, response: bytes) -> Optional[str]:
         """Process authentication response"""
-        self.logger.debug(f"Processing auth response: {response[:50]}...")
+        self.logger.debug("Processing auth response: %r...", response[:50])
 
         try:
-            parts = response.split()
+            code = response[:3]
+            accepted, message = AUTH_RESPONSES.get(
+                code, (False, f"Authentication failed with code: {code.decode('ascii', 'replace')}")
+            )
+            if not accepted:
+                self.logger.error(message)
+                return None
+
+            # "200 {session_key} LOGIN ACCEPTED"
+            parts = response.split(maxsplit=2)
             if len(parts) < 2:
                 self.logger.error("Invalid auth response format")
                 return None
 
-            code = parts[0]
-            if code in ['200', '201']:
-                self.logger.info("Authentication successful")
-                return parts[1]
-            else:
-                self.logger.error(f"Authentication failed with code: {code}")
-                return None
+            self.logger.info(message)
+            return parts[1].decode('ascii')
 
         except Exception as e:
             self.logger.error(f"Error processing auth response: {str(e)}")
             return None
 
-    def _process_anime_response(self, response: str) -> Optional[Dict[str, Any]]:
+    def _process_anime_response(self, response: bytes) -> Optional[Dict[str, Any]]:
         """Process anime query response"""
         self.logger.debug("Processing anime response")
 
         try:
-            lines = response.strip().split('\n')
-            if len(lines) < 2:
+            # Check the status code before touching the rest of the datagram
+            code = response[:3]
+            if code != b'230':
+                self.logger.error(f"Unexpected response code: {code.decode('ascii', 'replace')}")
+                return None
+
+            # Only the first data line is needed
+            lines = response.split(b'\n', 2)
+            if len(lines) < 2 or not lines[1]:
                 self.logger.error("Invalid response format")
                 return None
 
-            code = lines[0].split()[0]
-            if code != '230':
-                self.logger.error(f"Unexpected response code: {code}")
+            parts = lines[1].split(b'|')
+            if len(parts) < self._ANIME_FIELD_COUNT:
+                self.logger.error(f"Expected {self._ANIME_FIELD_COUNT} fields, got {len(parts)}")
                 return None
 
-            parts = lines[1].split('|')
-            result = {
-                'aid': int(parts[0]),
-                'year': parts[1],
-                'type': parts[2],
-                'romaji': parts[4],
-                'kanji': parts[5],
-                'english': parts[6],
-                'synonyms': parts[7],
-                'episodes': int(parts[8]) if parts[8].isdigit() else 0,
-                'ep_count': int(parts[9]) if parts[9].isdigit() else 0,
-                'special_count': int(parts[10]) if parts[10].isdigit() else 0,
-                'tag_name_list': parts[11],
-                'tag_id_list': parts[13],
-                'tag_weigth_list': parts[14]
-            }
-
-            self.logger.debug(f"Successfully parsed anime data for ID: {result['aid']}")
+            # int() parses the numeric fields straight from bytes
+            result = {name: convert(parts[index]) for name, index, convert in self._ANIME_FIELDS}
+
+            self.logger.debug("Successfully parsed anime data for ID: %s", result['aid'])
             return result
 
         except Exception as e:
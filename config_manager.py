@@ -1,8 +1,20 @@
 from pathlib import Path
 import configparser
 import json
+import re
+
+# Minimal INI grammar for the files written by save_config(): "[Section]" and "key = value" lines
+_SECTION_RE = re.compile(r'^\[([^\]\n]+)\][ \t]*$', re.MULTILINE)
+_OPTION_RE = re.compile(r'^([^\s#;=:\[][^=:\n]*?)[ \t]*[=:][ \t]*(.*?)[ \t]*$', re.MULTILINE)
 
 class ConfigManager:
+    __slots__ = ('logger', '_config', 'config_file', '_cache', '_dirty')
+
+    # Sections and options that must exist for the application to work
+    _REQUIRED = {
+        'AniDB': frozenset(['username', 'password', 'client', 'clientver', 'server', 'port', 'max_retries'])
+    }
+
     def __init__(self, logger):
         """
         Initialize ConfigManager.
@@ -13,8 +25,10 @@ class ConfigManager:
             Logger instance for tracking operations
         """
         self.logger = logger
-        self.config = configparser.ConfigParser()
+        self._config = None
         self.config_file = Path('config.ini')
+        self._cache = {}
+        self._dirty = False
         self.logger.info("Initializing ConfigManager")
         self.load_config()
 
@@ -22,18 +36,65 @@ class ConfigManager:
         """Load configuration from file or create default"""
         try:
             if self.config_file.exists():
-                self.config.read(self.config_file)
+                # Only the getters run at startup, configparser is built on first write
+                self._cache = self._parse_ini(self.config_file.read_text())
+                self._config = None
                 self.logger.info("Configuration loaded from file")
-                self.logger.debug(f"Config file path: {self.config_file}")
+                self.logger.debug("Config file path: %s", self.config_file)
             else:
                 self.logger.info("No config file found, creating default configuration")
+                # Written right away, the file is where the user enters the AniDB credentials
                 self._create_default_config()
+                self._refresh_cache()
         except Exception as e:
             self.logger.error(f"Error loading configuration: {str(e)}")
             raise
 
-    def _create_default_config(self):
-        """Create default configuration"""
+    @property
+    def config(self):
+        """configparser view of the configuration, created when it is first needed"""
+        if self._config is None:
+            self._config = configparser.ConfigParser()
+            self._config.read_dict(self._cache)
+        return self._config
+
+    @staticmethod
+    def _parse_ini(text):
+        """
+        Parse INI text into {section: {option: value}}.
+
+        Option names are lower-cased like configparser does.
+
+        Parameters
+        ----------
+        text : str
+            Content of the config file
+
+        Returns
+        -------
+        dict
+            Options per section
+        """
+        # split() yields [preamble, name, body, name, body, ...]
+        parts = _SECTION_RE.split(text)
+        return {
+            name.strip(): {key.lower(): value for key, value in _OPTION_RE.findall(body)}
+            for name, body in zip(parts[1::2], parts[2::2])
+        }
+
+    def _refresh_cache(self):
+        """Snapshot all sections into plain dicts so getters skip configparser"""
+        self._cache = {section: dict(self.config[section]) for section in self.config.sections()}
+
+    def _create_default_config(self, save: bool = True):
+        """
+        Create default configuration.
+
+        Parameters
+        ----------
+        save : bool
+            Write the defaults to the config file right away
+        """
         try:
             self.config['Path'] = {
                 'hentaiPath': '',
@@ -48,10 +109,13 @@ class ConfigManager:
                 'clientver': '1',
                 'server': 'api.anidb.net',
                 'port': '9000',
-                'max_retries': '3'
+                'max_retries': '3',
+                'max_concurrent': '8',
+                'command_interval': '2'
             }
 
-            self.save_config()
+            if save:
+                self.save_config()
             self.logger.info("Default configuration created")
         except Exception as e:
             self.logger.error(f"Error creating default config: {str(e)}")
@@ -63,11 +127,17 @@ class ConfigManager:
             with open(self.config_file, 'w') as configfile:
                 self.config.write(configfile)
             self.logger.info("Configuration saved to file")
-            self.logger.debug(f"Saved to: {self.config_file}")
+            self.logger.debug("Saved to: %s", self.config_file)
         except Exception as e:
             self.logger.error(f"Error saving configuration: {str(e)}")
             raise
 
+    def flush(self):
+        """Write pending changes to the config file, if there are any"""
+        if self._dirty:
+            self.save_config()
+            self._dirty = False
+
     def get_path(self, key):
         """
         Get path from config with error handling.
@@ -83,15 +153,18 @@ class ConfigManager:
             Configuration value if found, None otherwise
         """
         try:
-            value = self.config.get('Path', key)
-            self.logger.debug(f"Retrieved path for key '{key}': {value}")
+            section = self._cache.get('Path')
+            if section is None:
+                self.logger.error("Path section missing in config")
+                return None
+
+            value = section.get(key.lower())
+            if value is None:
+                self.logger.error(f"No configuration found for key: {key}")
+                return None
+
+            self.logger.debug("Retrieved path for key '%s': %s", key, value)
             return value
-        except configparser.NoSectionError:
-            self.logger.error("Path section missing in config")
-            return None
-        except configparser.NoOptionError:
-            self.logger.error(f"No configuration found for key: {key}")
-            return None
         except Exception as e:
             self.logger.error(f"Error retrieving path: {str(e)}")
             return None
@@ -99,6 +172,8 @@ class ConfigManager:
     def set_path(self, key, value):
         """
         Set path in config with error handling.
+
+        The change is written to disk on the next flush().
         
         Parameters
         ----------
@@ -113,7 +188,8 @@ class ConfigManager:
                 self.config.add_section('Path')
             
             self.config.set('Path', key, value)
-            self.save_config()
+            self._cache.setdefault('Path', {})[key.lower()] = value
+            self._dirty = True
             self.logger.info(f"Path updated - key: {key}, value: {value}")
         except Exception as e:
             self.logger.error(f"Error setting path: {str(e)}")
@@ -129,12 +205,13 @@ class ConfigManager:
             or None if not configured
         """
         try:
-            if not self.config.has_section('AniDB'):
+            anidb = self._cache.get('AniDB')
+            if anidb is None:
                 self.logger.error("No AniDB section in config")
                 return None
         
-            username = self.config.get('AniDB', 'username')
-            password = self.config.get('AniDB', 'password')
+            username = anidb.get('username')
+            password = anidb.get('password')
         
             if not username or not password:
                 self.logger.error("Username or password not configured")
@@ -145,7 +222,7 @@ class ConfigManager:
                 'password': password
             }
         
-            self.logger.debug(f"Retrieved credentials for username: {username}")
+            self.logger.debug("Retrieved credentials for username: %s", username)
             return credentials
         
         except Exception as e:
@@ -162,7 +239,8 @@ class ConfigManager:
             Dictionary containing all AniDB settings
         """
         try:
-            if not self.config.has_section('AniDB'):
+            anidb = self._cache.get('AniDB')
+            if anidb is None:
                 self.logger.error("No AniDB section in config")
                 return None
             
@@ -173,7 +251,11 @@ class ConfigManager:
             # Erweitere das credentials dictionary um zusätzliche Einstellungen
             settings = {
                 **credentials,  # Username und Password
-                'max_retries': self.config.getint('AniDB', 'max_retries', fallback=3)
+                'max_retries': int(anidb.get('max_retries', 3)),
+                # Ordner, die der Worker gleichzeitig verarbeitet
+                'max_concurrent': max(1, int(anidb.get('max_concurrent', 8))),
+                # Sekunden zwischen zwei AniDB-Befehlen, der Client erlaubt nicht weniger als 2
+                'command_interval': float(anidb.get('command_interval', 2))
             }
         
             self.logger.debug("Retrieved AniDB settings successfully")
@@ -193,19 +275,16 @@ class ConfigManager:
             True if configuration is valid, False otherwise
         """
         try:
-            required_sections = {
-                'AniDB': ['username', 'password','client','clientver','server','port','max_retries']
-            }
-
-            for section, options in required_sections.items():
-                if not self.config.has_section(section):
+            for section, options in self._REQUIRED.items():
+                if section not in self._cache:
                     self.logger.error(f"Missing required section: {section}")
                     return False
-                    
-                for option in options:
-                    if not self.config.has_option(section, option):
+
+                missing = options.difference(self._cache[section])
+                if missing:
+                    for option in sorted(missing):
                         self.logger.error(f"Missing required option '{option}' in section '{section}'")
-                        return False
+                    return False
 
             self.logger.info("Configuration integrity check passed")
             return True
@@ -1,8 +1,18 @@
+import functools
+import logging
 import sqlite3
-from typing import Optional, List, Dict, Any, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Any, Tuple, Iterable, Set
 from pathlib import Path
 import json
 
+
+@functools.lru_cache(maxsize=None)
+def _resolve_path(path: str) -> str:
+    """Returns the canonical form of a path, as compared by clean_database."""
+    return str(Path(path).resolve())
+
+
 class AnimeDatabase:
     """
     A class used to manage a database of anime information.
@@ -17,16 +27,80 @@ class AnimeDatabase:
         Logger instance for tracking database operations.
     """
 
+    _ADD_ANIME_QUERY = """
+    INSERT INTO anime_info (
+        aid, year, type, romaji, kanji, synonyms, episodes, ep_count,
+        special_count, tag_id_list, tag_weigth_list, path, folder_mtime
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(aid) DO UPDATE SET
+        year = excluded.year,
+        type = excluded.type,
+        romaji = excluded.romaji,
+        kanji = excluded.kanji,
+        synonyms = excluded.synonyms,
+        episodes = excluded.episodes,
+        ep_count = excluded.ep_count,
+        special_count = excluded.special_count,
+        tag_id_list = excluded.tag_id_list,
+        tag_weigth_list = excluded.tag_weigth_list,
+        path = excluded.path,
+        folder_mtime = excluded.folder_mtime
+    """
+
+    _ANIME_EXISTS_QUERY = "SELECT EXISTS(SELECT 1 FROM anime_info WHERE romaji = ?)"
+    _EXISTING_ANIME_QUERY = "SELECT romaji FROM anime_info WHERE romaji IN ({placeholders})"
+    _FOLDER_MTIMES_QUERY = (
+        "SELECT path, folder_mtime FROM anime_info "
+        "WHERE folder_mtime IS NOT NULL AND path IN ({placeholders})"
+    )
+    # Stays below SQLITE_MAX_VARIABLE_NUMBER of older SQLite builds (999)
+    _MAX_QUERY_PARAMS = 900
+
+    _ADD_TAG_QUERY = "INSERT INTO tags (tag_name) VALUES (?) ON CONFLICT(tag_name) DO NOTHING"
+    _TAG_IDS_QUERY = "SELECT tag_name, id FROM tags WHERE tag_name IN ({placeholders})"
+    _LINK_TAG_QUERY = "INSERT OR IGNORE INTO anime_tags (anime_id, tag_id) VALUES (?, ?)"
+
+    _ANIME_LIST_QUERY = (
+        "SELECT aid, year, type, romaji, kanji, synonyms, episodes, ep_count, "
+        "special_count, tag_id_list, tag_weigth_list, path FROM anime_info"
+    )
+    _ANIME_LIST_COLUMNS = (
+        'aid', 'year', 'type', 'romaji', 'kanji', 'synonyms', 'episodes', 'ep_count',
+        'special_count', 'tag_id_list', 'tag_weigth_list', 'path'
+    )
+    _ANIME_BY_PATH_QUERY = _ANIME_LIST_QUERY + " WHERE path IN ({placeholders})"
+    _STALE_ANIME_QUERY = (
+        "SELECT aid, romaji, path FROM anime_info "
+        "WHERE path IS NULL OR path NOT IN (SELECT value FROM json_each(?))"
+    )
+    _DELETE_ANIME_QUERY = "DELETE FROM anime_info WHERE aid = ?"
+
+    # Size of sqlite3's per-connection cache of compiled statements (default 128)
+    CACHED_STATEMENTS = 256
+
     def __init__(self, logger=None, db_path="anime.db" ):
         self.logger = logger
         self.db_path = db_path
         self.logger.info(f"Initializing database connection to {db_path}")
 
         try:
-            self.conn = sqlite3.connect(db_path)
+            self.conn = sqlite3.connect(db_path, cached_statements=self.CACHED_STATEMENTS)
             self.cursor = self.conn.cursor()
+
+            # WAL + NORMAL sync: commits no longer fsync the main database file
+            journal_mode = self.cursor.execute("PRAGMA journal_mode=WAL").fetchone()[0]
+            self.cursor.execute("PRAGMA synchronous=NORMAL")
+            self.cursor.execute("PRAGMA temp_store=MEMORY")
+            self.cursor.execute("PRAGMA cache_size=-65536")  # 64 MiB page cache
+            self.cursor.execute("PRAGMA mmap_size=268435456")  # 256 MiB memory-mapped I/O
+            self.cursor.execute("PRAGMA busy_timeout=5000")
+            if journal_mode.lower() != 'wal':
+                self.logger.warning(f"WAL journal mode not available, using {journal_mode}")
+            self.logger.debug(f"Database journal mode: {journal_mode}")
             self.logger.debug("Database connection established successfully")
             self.create_table()
+            # Refresh planner statistics where needed, so lookups use the indexes
+            self.cursor.execute("PRAGMA optimize")
         except sqlite3.Error as e:
             self.logger.error(f"Failed to initialize database: {str(e)}")
             raise
@@ -49,7 +123,8 @@ class AnimeDatabase:
                 special_count INTEGER,
                 tag_id_list TEXT,
                 tag_weigth_list TEXT,
-                path TEXT
+                path TEXT,
+                folder_mtime INTEGER
             );""",
             'tags': """
             CREATE TABLE IF NOT EXISTS tags (
@@ -63,12 +138,28 @@ class AnimeDatabase:
                 FOREIGN KEY (anime_id) REFERENCES anime_info(aid),
                 FOREIGN KEY (tag_id) REFERENCES tags(id),
                 PRIMARY KEY (anime_id, tag_id)
-            );"""
+            );""",
+            'idx_anime_info_romaji': """
+            CREATE INDEX IF NOT EXISTS idx_anime_info_romaji
+                ON anime_info(romaji);""",
+            'idx_anime_info_path': """
+            CREATE INDEX IF NOT EXISTS idx_anime_info_path
+                ON anime_info(path);""",
+            'idx_anime_tags_tag': """
+            CREATE INDEX IF NOT EXISTS idx_anime_tags_tag
+                ON anime_tags(tag_id, anime_id);"""
         }
 
         try:
             for table_name, query in create_table_queries.items():
-                self.logger.debug(f"Creating table {table_name} if not exists")
+                self.logger.debug(f"Creating {table_name} if not exists")
+                self.cursor.execute(query)
+
+            # Databases from older versions lack the folder_mtime column
+            columns = {row[1] for row in self.cursor.execute("PRAGMA table_info(anime_info)")}
+            if 'folder_mtime' not in columns:
+                self.logger.info("Adding folder_mtime column to anime_info")
+                query = "ALTER TABLE anime_info ADD COLUMN folder_mtime INTEGER"
                 self.cursor.execute(query)
 
             self.conn.commit()
@@ -79,7 +170,8 @@ class AnimeDatabase:
             self.logger.debug(f"Failed query: {query}")
             raise
 
-    def add_anime(self, anime_info: Dict[str, Any], path: str) -> Optional[int]:
+    def add_anime(self, anime_info: Dict[str, Any], path: str,
+                  folder_mtime: Optional[int] = None) -> Optional[int]:
         """
         Adds or updates an anime entry in the database.
 
@@ -89,6 +181,8 @@ class AnimeDatabase:
             Dictionary containing anime information
         path : str
             File system path to the anime
+        folder_mtime : Optional[int]
+            st_mtime_ns of the anime folder, lets later scans skip it while unchanged
 
         Returns
         -------
@@ -96,48 +190,17 @@ class AnimeDatabase:
             The ID of the inserted/updated record, or None if operation failed
         """
         self.logger.info(f"Adding/updating anime: {anime_info.get('romaji', 'Unknown title')}")
-        self.logger.debug(f"Anime data: {json.dumps(anime_info, ensure_ascii=False)}")
-
-        add_anime_query = """
-        INSERT INTO anime_info (
-            aid, year, type, romaji, kanji, synonyms, episodes, ep_count,
-            special_count, tag_id_list, tag_weigth_list, path
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ON CONFLICT(aid) DO UPDATE SET
-            year = excluded.year,
-            type = excluded.type,
-            romaji = excluded.romaji,
-            kanji = excluded.kanji,
-            synonyms = excluded.synonyms,
-            episodes = excluded.episodes,
-            ep_count = excluded.ep_count,
-            special_count = excluded.special_count,
-            tag_id_list = excluded.tag_id_list,
-            tag_weigth_list = excluded.tag_weigth_list,
-            path = excluded.path
-        """
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Anime data: %s", json.dumps(anime_info, ensure_ascii=False))
 
         try:
-            self.cursor.execute(add_anime_query, (
-                anime_info['aid'],
-                anime_info['year'],
-                anime_info['type'],
-                anime_info['romaji'],
-                anime_info['kanji'],
-                anime_info['synonyms'],
-                anime_info['episodes'],
-                anime_info['ep_count'],
-                anime_info['special_count'],
-                anime_info['tag_id_list'],
-                anime_info['tag_weigth_list'],
-                path
-            ))
+            self.cursor.execute(self._ADD_ANIME_QUERY, self._anime_params(anime_info, path, folder_mtime))
 
             anime_id = self.cursor.lastrowid
             self.conn.commit()
 
             self.logger.info(f"Successfully added/updated anime with ID {anime_info['aid']}")
-            self.logger.debug(f"Database record ID: {anime_id}")
+            self.logger.debug("Database record ID: %s", anime_id)
 
             return anime_id
 
@@ -153,6 +216,60 @@ class AnimeDatabase:
             self.logger.error(f"Unexpected error while adding anime: {str(e)}")
             return None
 
+    def add_anime_many(self, rows: List[tuple]) -> int:
+        """
+        Adds or updates several anime entries in a single transaction.
+
+        Parameters
+        ----------
+        rows : List[tuple]
+            (anime information, file system path) pairs, optionally followed
+            by the st_mtime_ns of the folder
+
+        Returns
+        -------
+        int
+            Number of rows written, 0 if the batch failed
+        """
+        if not rows:
+            return 0
+
+        self.logger.info(f"Adding/updating {len(rows)} anime in one transaction")
+
+        try:
+            params = [self._anime_params(*row) for row in rows]
+            with self.conn:
+                self.cursor.executemany(self._ADD_ANIME_QUERY, params)
+
+            self.logger.info(f"Successfully added/updated {len(params)} anime")
+            return len(params)
+
+        except sqlite3.Error as e:
+            self.logger.error(f"Database error while adding anime batch: {str(e)}")
+            return 0
+        except KeyError as e:
+            self.logger.error(f"Missing required field in anime_info: {str(e)}")
+            return 0
+
+    @staticmethod
+    def _anime_params(anime_info: Dict[str, Any], path: str, folder_mtime: Optional[int] = None) -> tuple:
+        """Builds the parameter tuple for the anime_info upsert."""
+        return (
+            anime_info['aid'],
+            anime_info['year'],
+            anime_info['type'],
+            anime_info['romaji'],
+            anime_info['kanji'],
+            anime_info['synonyms'],
+            anime_info['episodes'],
+            anime_info['ep_count'],
+            anime_info['special_count'],
+            anime_info['tag_id_list'],
+            anime_info['tag_weigth_list'],
+            path,
+            folder_mtime
+        )
+
     def add_tags_and_link_to_anime(self, anime_id: int, tag_names: List[str]) -> bool:
         """
         Adds tags to the database and links them to the specified anime.
@@ -170,37 +287,34 @@ class AnimeDatabase:
             True if operation was successful, False otherwise
         """
         self.logger.info(f"Adding and linking tags for anime ID {anime_id}")
-        self.logger.debug(f"Tags to process: {tag_names}")
-
-        try:
-            for tag_name in tag_names:
-                # Add tag if not exists
-                self.logger.debug(f"Processing tag: {tag_name}")
+        self.logger.debug("Tags to process: %s", tag_names)
 
-                self.cursor.execute(
-                    "INSERT INTO tags (tag_name) VALUES (?) ON CONFLICT(tag_name) DO NOTHING",
-                    (tag_name,)
-                )
-
-                # Get tag ID
-                self.cursor.execute("SELECT id FROM tags WHERE tag_name = ?", (tag_name,))
-                tag_id = self.cursor.fetchone()[0]
+        # Duplicates would only repeat the same insert and link
+        tag_names = list(dict.fromkeys(tag_names))
+        if not tag_names:
+            return True
 
-                # Link tag to anime
-                self.cursor.execute(
-                    "INSERT INTO anime_tags (anime_id, tag_id) VALUES (?, ?)",
-                    (anime_id, tag_id)
+        try:
+            with self.conn:
+                # Add missing tags
+                self.cursor.executemany(self._ADD_TAG_QUERY, [(tag_name,) for tag_name in tag_names])
+
+                # Get all tag IDs in one query
+                placeholders = ",".join("?" * len(tag_names))
+                self.cursor.execute(self._TAG_IDS_QUERY.format(placeholders=placeholders), tag_names)
+                tag_ids = dict(self.cursor.fetchall())
+
+                # Link tags to anime
+                self.cursor.executemany(
+                    self._LINK_TAG_QUERY,
+                    [(anime_id, tag_ids[tag_name]) for tag_name in tag_names]
                 )
 
-                self.logger.debug(f"Tag {tag_name} (ID: {tag_id}) linked to anime {anime_id}")
-
-            self.conn.commit()
             self.logger.info(f"Successfully processed {len(tag_names)} tags for anime {anime_id}")
             return True
 
         except sqlite3.Error as e:
             self.logger.error(f"Database error while processing tags: {str(e)}")
-            self.conn.rollback()
             return False
         except Exception as e:
             self.logger.error(f"Unexpected error while processing tags: {str(e)}")
@@ -220,22 +334,114 @@ class AnimeDatabase:
         bool
             True if anime exists, False otherwise
         """
-        self.logger.debug(f"Checking if anime exists: {romaji}")
-
         try:
-            self.cursor.execute(
-                "SELECT 1 FROM anime_info WHERE romaji = ? LIMIT 1",
-                (romaji,)
-            )
-            exists = self.cursor.fetchone() is not None
+            self.cursor.execute(self._ANIME_EXISTS_QUERY, (romaji,))
+            exists = bool(self.cursor.fetchone()[0])
 
-            self.logger.debug(f"Anime '{romaji}' {'exists' if exists else 'does not exist'}")
+            self.logger.debug("Anime '%s' %s", romaji, 'exists' if exists else 'does not exist')
             return exists
 
         except sqlite3.Error as e:
             self.logger.error(f"Database error while checking anime existence: {str(e)}")
             return False
 
+    def existing_anime(self, names: Iterable[str]) -> Set[str]:
+        """
+        Returns which of the given romaji names already exist in the database.
+
+        One query per chunk of parameters replaces an anime_exists() call per name.
+
+        Parameters
+        ----------
+        names : Iterable[str]
+            The romaji names to check
+
+        Returns
+        -------
+        Set[str]
+            The names that exist, an empty set if the lookup failed
+        """
+        names = list(dict.fromkeys(names))
+        existing = set()
+
+        try:
+            for start in range(0, len(names), self._MAX_QUERY_PARAMS):
+                chunk = names[start:start + self._MAX_QUERY_PARAMS]
+                placeholders = ",".join("?" * len(chunk))
+                self.cursor.execute(self._EXISTING_ANIME_QUERY.format(placeholders=placeholders), chunk)
+                existing.update(row[0] for row in self.cursor.fetchall())
+
+            self.logger.debug("%d of %d anime already in database", len(existing), len(names))
+            return existing
+
+        except sqlite3.Error as e:
+            self.logger.error(f"Database error while checking anime existence: {str(e)}")
+            return set()
+
+    def get_folder_mtimes(self, paths: Iterable[str]) -> Dict[str, int]:
+        """
+        Returns the stored folder modification times for the given paths.
+
+        Parameters
+        ----------
+        paths : Iterable[str]
+            File system paths of anime folders
+
+        Returns
+        -------
+        Dict[str, int]
+            st_mtime_ns per path, only for paths stored with a modification time
+        """
+        paths = list(dict.fromkeys(paths))
+        mtimes = {}
+
+        try:
+            for start in range(0, len(paths), self._MAX_QUERY_PARAMS):
+                chunk = paths[start:start + self._MAX_QUERY_PARAMS]
+                placeholders = ",".join("?" * len(chunk))
+                self.cursor.execute(self._FOLDER_MTIMES_QUERY.format(placeholders=placeholders), chunk)
+                mtimes.update(self.cursor.fetchall())
+
+            self.logger.debug("Found stored modification times for %d folders", len(mtimes))
+            return mtimes
+
+        except sqlite3.Error as e:
+            self.logger.error(f"Database error while reading folder modification times: {str(e)}")
+            return {}
+
+    def get_anime_by_paths(self, paths: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns the stored anime information for the given folder paths.
+
+        Parameters
+        ----------
+        paths : Iterable[str]
+            File system paths of anime folders
+
+        Returns
+        -------
+        Dict[str, Dict[str, Any]]
+            Anime information per path, only for paths found in the database
+        """
+        paths = list(dict.fromkeys(paths))
+        anime = {}
+
+        try:
+            for start in range(0, len(paths), self._MAX_QUERY_PARAMS):
+                chunk = paths[start:start + self._MAX_QUERY_PARAMS]
+                placeholders = ",".join("?" * len(chunk))
+                self.cursor.execute(self._ANIME_BY_PATH_QUERY.format(placeholders=placeholders), chunk)
+                for row in self.cursor.fetchall():
+                    anime_info = dict(zip(self._ANIME_LIST_COLUMNS, row))
+                    anime[anime_info['path']] = anime_info
+
+            self.logger.debug("Found stored anime for %d of %d folders", len(anime), len(paths))
+            return anime
+
+        except sqlite3.Error as e:
+            self.logger.error(f"Database error while reading anime by path: {str(e)}")
+            return {}
+
     def get_anime_list(self) -> List[tuple]:
         """
         Retrieves a list of all anime in the database.
@@ -248,7 +454,8 @@ class AnimeDatabase:
         self.logger.info("Retrieving complete anime list")
 
         try:
-            self.cursor.execute("SELECT * FROM anime_info")
+            # Explicit columns, new columns do not change the shape of the rows
+            self.cursor.execute(self._ANIME_LIST_QUERY)
             results = self.cursor.fetchall()
 
             self.logger.info(f"Retrieved {len(results)} anime records")
@@ -259,14 +466,14 @@ class AnimeDatabase:
             self.logger.error(f"Database error while retrieving anime list: {str(e)}")
             return []
         
-    def clean_database(self, existing_paths: List[str] = None) -> Tuple[int, List[str]]:
+    def clean_database(self, existing_paths: Optional[Iterable[str]] = None) -> Tuple[int, List[str]]:
         """
         Clean the database by removing entries with non-existing paths or all entries if no paths provided.
         
         Parameters
         ----------
-        existing_paths : List[str], optional
-            List of valid paths to keep. If None, removes all entries.
+        existing_paths : Iterable[str], optional
+            Valid paths to keep (list or set). If None, removes all entries.
             
         Returns
         -------
@@ -289,19 +496,27 @@ class AnimeDatabase:
                 removed_anime = [entry[0] for entry in all_entries]
                 
             else:
-                # Convert paths to set for faster lookup
-                valid_paths = set(str(Path(p).resolve()) for p in existing_paths)
-                
-                # Get entries with invalid paths
-                self.cursor.execute("SELECT aid, romaji, path FROM anime_info")
-                entries = self.cursor.fetchall()
-                
-                for aid, romaji, path in entries:
-                    if not path or str(Path(path).resolve()) not in valid_paths:
-                        self.cursor.execute("DELETE FROM anime_info WHERE aid = ?", (aid,))
-                        deleted_count += 1
-                        removed_anime.append(romaji)
-                        self.logger.debug(f"Removed entry for {romaji} with invalid path: {path}")
+                existing_paths = {str(p) for p in existing_paths}
+                # resolve() stats every path component, run the lookups in parallel
+                with ThreadPoolExecutor() as pool:
+                    valid_paths = set(pool.map(_resolve_path, existing_paths))
+
+                # Let SQLite filter out entries whose stored path matches a valid path as-is;
+                # all paths are bound as one JSON array, no temporary table needed
+                self.cursor.execute(
+                    self._STALE_ANIME_QUERY,
+                    (json.dumps(list(existing_paths | valid_paths), ensure_ascii=False),)
+                )
+                candidates = self.cursor.fetchall()
+
+                # Only the remaining entries need resolving, e.g. paths stored in another form
+                stale = [
+                    (aid, romaji) for aid, romaji, path in candidates
+                    if not path or _resolve_path(path) not in valid_paths
+                ]
+                self.cursor.executemany(self._DELETE_ANIME_QUERY, [(aid,) for aid, _ in stale])
+                deleted_count = len(stale)
+                removed_anime = [romaji for _, romaji in stale]
 
             self.conn.commit()
             self.logger.info(f"Database cleanup completed: removed {deleted_count} entries")
@@ -315,28 +530,37 @@ class AnimeDatabase:
             self.logger.error(f"Unexpected error during database cleanup: {str(e)}")
             self.conn.rollback()
             raise
+        finally:
+            # Paths can change between cleanups, do not keep stale resolutions
+            _resolve_path.cache_clear()
 
     def close(self):
-        """Closes the database connection."""
+        """Closes the database connection. Calling it again has no effect."""
+        if self.conn is None:
+            return
+
         self.logger.info("Closing database connection")
 
         try:
             if self.cursor:
                 self.cursor.close()
-            if self.conn:
-                self.conn.commit()
-                self.conn.close()
+            self.conn.commit()
+            # Maintenance at a known point instead of during a later commit
+            self.conn.execute("PRAGMA optimize")
+            self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            self.conn.close()
             self.logger.debug("Database connection closed successfully")
 
         except sqlite3.Error as e:
             self.logger.error(f"Error while closing database connection: {str(e)}")
         except Exception as e:
             self.logger.error(f"Unexpected error while closing database: {str(e)}")
+        finally:
+            self.cursor = None
+            self.conn = None
 
-    def __del__(self):
-        """Destructor to ensure database connection is closed."""
-        self.logger.debug("Database object being destroyed")
-        try:
-            self.close()
-        except Exception as e:
-            self.logger.error(f"Error in destructor: {str(e)}")
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
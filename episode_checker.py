@@ -1,6 +1,8 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 class EpisodeChecker:
+    MAX_WORKERS = 8  # Ordner, die gleichzeitig gezählt werden
     def __init__(self, root_folder, hentai_data):
         """
         :param root_folder: Pfad zum Hauptordner mit den Hentai-Unterordnern.
@@ -9,14 +11,29 @@ class EpisodeChecker:
         self.root_folder = root_folder
         self.hentai_data = hentai_data
 
+    @staticmethod
+    def count_files(folder):
+        """
+        :param folder: Pfad zum Ordner, dessen Dateien gezählt werden.
+        :return: Anzahl der Dateien oder None, wenn der Ordner nicht existiert.
+        """
+        try:
+            # DirEntry.is_file() nutzt die Verzeichnisdaten, kein stat() pro Datei
+            with os.scandir(folder) as entries:
+                return sum(1 for entry in entries if entry.is_file())
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+
     def check_missing_episodes(self):
         missing_episodes = {}
+        folders = [os.path.join(self.root_folder, hentai) for hentai in self.hentai_data]
+
+        # Jeder Ordner wird unabhängig gezählt, die Wartezeit liegt beim Dateisystem
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as pool:
+            counts = pool.map(self.count_files, folders)
 
-        for hentai, expected_count in self.hentai_data.items():
-            hentai_folder = os.path.join(self.root_folder, hentai)
-            if os.path.exists(hentai_folder):
-                actual_count = len([f for f in os.listdir(hentai_folder) if os.path.isfile(os.path.join(hentai_folder, f))])
-                if actual_count < expected_count:
+            for (hentai, expected_count), actual_count in zip(self.hentai_data.items(), counts):
+                if actual_count is not None and actual_count < expected_count:
                     missing_episodes[hentai] = expected_count - actual_count
 
         return missing_episodes
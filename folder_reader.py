@@ -7,7 +7,9 @@ class HentaiFolderReader:
     def get_hentai_names(self):
         """Liefert eine Liste von Hentai-Namen basierend auf den Unterordnern."""
         try:
-            return [folder for folder in os.listdir(self.root_folder) if os.path.isdir(os.path.join(self.root_folder, folder))]
+            with os.scandir(self.root_folder) as entries:
+                # Verlinkte Ordner zählen mit, wie bei os.path.isdir und dem Scan im Widget
+                return [entry.name for entry in entries if entry.is_dir()]
         except Exception as e:
             print(f"Error reading the folder: {e}")
             return []
@@ -1,22 +1,83 @@
 import json
-from typing import Dict, List, Optional
+import functools
+import marshal
+from types import MappingProxyType
+from typing import List, Mapping, Optional, Tuple
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the stdlib parser
+    orjson = None
+
+_json_loads = orjson.loads if orjson else json.loads
+
+# Whitespace removed from tag ID strings before splitting, IDs never contain any
+_WHITESPACE = str.maketrans('', '', ' \t\r\n')
+
+
+@functools.lru_cache(maxsize=1)
+def _load_tag_file(tags_file: Path, mtime_ns: int) -> Tuple[Mapping[str, str], int]:
+    """
+    Parse the tags file once per process and version of the file.
+
+    The parsed table is also kept next to the file in marshal format, so later
+    starts skip the JSON parsing as long as the file is unchanged.
+
+    Parameters
+    ----------
+    tags_file : Path
+        Path to the tags JSON file
+    mtime_ns : int
+        Modification time of the file, part of the cache key
+
+    Returns
+    -------
+    Tuple[Mapping[str, str], int]
+        Read-only mapping of tag IDs to names and the number of skipped entries
+    """
+    cache_file = tags_file.with_suffix('.cache')
+    try:
+        cached_mtime, tag_dict, skipped = marshal.loads(cache_file.read_bytes())
+        if cached_mtime == mtime_ns:
+            return MappingProxyType(tag_dict), skipped
+    except (OSError, EOFError, ValueError, TypeError):
+        pass  # No usable cache, parse the JSON file
+
+    data = _json_loads(tags_file.read_bytes())
+
+    # Validate data structure
+    if not isinstance(data, list):
+        raise ValueError("Invalid tags file format: root element must be an array")
+
+    valid = [item for item in data if isinstance(item, dict) and 'id' in item and 'name' in item]
+    # Convert ID to string for consistency
+    tag_dict = {str(item['id']): item['name'] for item in valid}
+    skipped = len(data) - len(valid)
+
+    try:
+        cache_file.write_bytes(marshal.dumps((mtime_ns, tag_dict, skipped)))
+    except (OSError, ValueError):
+        pass  # The cache is only an optimization
+
+    return MappingProxyType(tag_dict), skipped
+
+
 class TagIDReader:
     """
     A class to read tag IDs from a JSON file and retrieve their corresponding names.
 
     Attributes
     ----------
-    tag_id_name_dict : Dict[str, str]
-        A dictionary mapping tag IDs to their names.
+    tag_id_name_dict : Mapping[str, str]
+        A read-only mapping of tag IDs to their names, shared by all readers.
     logger : logging.Logger
         Logger instance for tracking operations.
 
     Methods
     -------
-    load_tag_ids() -> Dict[str, str]
-        Loads tag IDs from the JSON file and returns a dictionary mapping IDs to names.
+    load_tag_ids() -> Mapping[str, str]
+        Loads tag IDs from the JSON file and returns a mapping of IDs to names.
 
     get_names_by_ids(tag_ids_string: str) -> List[str]
         Takes a string of comma-separated tag IDs and returns a list of their corresponding names.
@@ -34,7 +95,8 @@ class TagIDReader:
         self.logger = logger
         self.logger.info("Initializing TagIDReader")
         self.tags_file = Path("tags.json")
-        self.tag_id_name_dict: Dict[str, str] = {}
+        self.tag_id_name_dict: Mapping[str, str] = {}
+        self._tags_mtime: Optional[int] = None
 
         try:
             self.tag_id_name_dict = self.load_tag_ids()
@@ -43,14 +105,17 @@ class TagIDReader:
             self.logger.error(f"Failed to initialize TagIDReader: {str(e)}")
             raise
 
-    def load_tag_ids(self) -> Dict[str, str]:
+    def load_tag_ids(self) -> Mapping[str, str]:
         """
         Load and parse the tags JSON file.
 
+        The parsed table is cached for the whole process, so only the first
+        reader pays for reading the file. A changed file is parsed again.
+
         Returns
         -------
-        Dict[str, str]
-            Dictionary mapping tag IDs to tag names
+        Mapping[str, str]
+            Read-only mapping of tag IDs to tag names
 
         Raises
         ------
@@ -61,32 +126,20 @@ class TagIDReader:
         """
         self.logger.debug(f"Loading tags from {self.tags_file}")
 
-        if not self.tags_file.exists():
+        try:
+            mtime_ns = self.tags_file.stat().st_mtime_ns
+        except FileNotFoundError:
             self.logger.error(f"Tags file not found: {self.tags_file}")
             raise FileNotFoundError(f"Tags file not found: {self.tags_file}")
 
         try:
-            with open(self.tags_file, "r", encoding='utf-8') as file:
-                self.logger.debug("Reading tags.json file")
-                data = json.load(file)
-
-                # Validate data structure
-                if not isinstance(data, list):
-                    self.logger.error("Invalid tags file format: root element must be an array")
-                    raise ValueError("Invalid tags file format: root element must be an array")
-
-                # Create dictionary with validation
-                tag_dict = {}
-                for item in data:
-                    if not isinstance(item, dict) or 'id' not in item or 'name' not in item:
-                        self.logger.warning(f"Skipping invalid tag entry: {item}")
-                        continue
+            tag_dict, skipped = _load_tag_file(self.tags_file, mtime_ns)
+            self._tags_mtime = mtime_ns
+            if skipped:
+                self.logger.warning(f"Skipped {skipped} invalid tag entries")
 
-                    tag_id = str(item['id'])  # Convert ID to string for consistency
-                    tag_dict[tag_id] = item['name']
-
-                self.logger.debug(f"Successfully loaded {len(tag_dict)} tags")
-                return tag_dict
+            self.logger.debug(f"Successfully loaded {len(tag_dict)} tags")
+            return tag_dict
 
         except json.JSONDecodeError as e:
             self.logger.error(f"Invalid JSON in tags file: {str(e)}")
@@ -109,7 +162,7 @@ class TagIDReader:
         List[str]
             List of tag names corresponding to the provided IDs
         """
-        self.logger.debug(f"Processing tag IDs: {tag_ids_string}")
+        self.logger.debug("Processing tag IDs: %s", tag_ids_string)
 
         if not tag_ids_string:
             self.logger.warning("Empty tag_ids_string provided")
@@ -117,27 +170,18 @@ class TagIDReader:
 
         try:
             # Split and clean tag IDs
-            tag_id_list = [id.strip() for id in tag_ids_string.split(',') if id.strip()]
-            self.logger.debug(f"Found {len(tag_id_list)} tag IDs to process")
-
-            names = []
-            missing_ids = []
-
-            for tag_id in tag_id_list:
-                if tag_id in self.tag_id_name_dict:
-                    name = self.tag_id_name_dict[tag_id]
-                    names.append(name)
-                    self.logger.debug(f"Mapped tag ID {tag_id} to name: {name}")
-                else:
-                    self.logger.warning(f"Tag ID not found: {tag_id}")
-                    missing_ids.append(tag_id)
-                    names.append("")
+            tag_id_list = [tag_id for tag_id in tag_ids_string.translate(_WHITESPACE).split(',') if tag_id]
+            self.logger.debug("Found %d tag IDs to process", len(tag_id_list))
+
+            lookup = self.tag_id_name_dict.get
+            names = [lookup(tag_id, "") for tag_id in tag_id_list]
 
             # Log summary
+            missing_ids = [tag_id for tag_id, name in zip(tag_id_list, names) if not name]
             if missing_ids:
-                self.logger.warning(f"Missing tags: {', '.join(missing_ids)}")
+                self.logger.warning("Missing tags: %s", ', '.join(missing_ids))
             else:
-                self.logger.info(f"Successfully mapped all {len(tag_id_list)} tag IDs")
+                self.logger.info("Successfully mapped all %d tag IDs", len(tag_id_list))
 
             return names
 
@@ -156,6 +200,10 @@ class TagIDReader:
         """
         self.logger.info("Reloading tags from file")
         try:
+            if self.tags_file.stat().st_mtime_ns == self._tags_mtime:
+                self.logger.info("Tags file unchanged, keeping loaded tags")
+                return True
+
             new_tags = self.load_tag_ids()
             self.tag_id_name_dict = new_tags
             self.logger.info(f"Successfully reloaded {len(new_tags)} tags")
@@ -174,7 +222,7 @@ class TagIDReader:
             Number of tags in the dictionary
         """
         count = len(self.tag_id_name_dict)
-        self.logger.debug(f"Current tag count: {count}")
+        self.logger.debug("Current tag count: %d", count)
         return count
 
     def get_tag_name(self, tag_id: str) -> Optional[str]:
@@ -193,7 +241,7 @@ class TagIDReader:
         """
         name = self.tag_id_name_dict.get(tag_id)
         if name:
-            self.logger.debug(f"Found tag name for ID {tag_id}: {name}")
+            self.logger.debug("Found tag name for ID %s: %s", tag_id, name)
         else:
-            self.logger.debug(f"No tag name found for ID {tag_id}")
+            self.logger.debug("No tag name found for ID %s", tag_id)
         return name
@@ -1,7 +1,59 @@
+import functools
 import json
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the stdlib module
+    orjson = None
+
+if orjson:
+    _json_loads = orjson.loads
+
+    def _json_dumps(data: Dict[str, Any]) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+else:
+    _json_loads = json.loads
+
+    def _json_dumps(data: Dict[str, Any]) -> bytes:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+# Keys every aniinfo.json has to provide with a non-empty value
+_REQUIRED_KEYS = (
+    'aid', 'year', 'type', 'romaji', 'kanji', 'english', 'synonyms',
+    'episodes', 'ep_count', 'special_count', 'tag_name_list',
+    'tag_id_list', 'tag_weigth_list'
+)
+_REQUIRED_KEY_SET = frozenset(_REQUIRED_KEYS)
+_MISSING = object()
+
+
+@functools.lru_cache(maxsize=4096)
+def _load_json_file(file_path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Parse an aniinfo.json file once per version of the file.
+
+    Re-scans of the same folders find the parsed object here and only pay for
+    the stat() call. Parse errors are not cached.
+
+    Parameters
+    ----------
+    file_path : str
+        Path to the JSON file
+    mtime_ns : int
+        Modification time of the file, part of the cache key
+    size : int
+        Size of the file, part of the cache key
+
+    Returns
+    -------
+    Dict[str, Any]
+        The parsed anime information, shared between callers
+    """
+    with open(file_path, 'rb') as file:
+        return _json_loads(file.read())
+
 class AnimeInfoManager:
     """
     A class to manage anime information stored in a JSON file.
@@ -58,8 +110,9 @@ class AnimeInfoManager:
                 self.logger.error("Data integrity check failed, aborting JSON creation")
                 return False
 
-            with open(self.file_path, 'w', encoding='utf-8') as file:
-                json.dump(anime_info, file, indent=4, ensure_ascii=False)
+            # Encoded to UTF-8 bytes in one call and written in one go
+            with open(self.file_path, 'wb') as file:
+                file.write(_json_dumps(anime_info))
                 
             self.logger.info("JSON file created successfully")
             self.logger.debug(f"Written to: {self.file_path}")
@@ -85,14 +138,20 @@ class AnimeInfoManager:
             Dictionary containing anime information or None if reading fails
         """
         self.logger.info(f"Reading JSON file from: {self.file_path}")
-        
-        if not self.check_file_existence():
+
+        try:
+            # One stat() replaces the existence check and keys the parse cache
+            file_stat = self.file_path.stat()
+        except FileNotFoundError:
             self.logger.warning("JSON file does not exist")
             return None
+        except Exception as e:
+            self.logger.error(f"Unexpected error reading JSON file: {str(e)}")
+            return None
 
         try:
-            with open(self.file_path, 'r', encoding='utf-8') as file:
-                anime_info = json.load(file)
+            # Copy, so callers cannot change the cached object
+            anime_info = dict(_load_json_file(str(self.file_path), file_stat.st_mtime_ns, file_stat.st_size))
                 
             if self.check_data_integrity(anime_info):
                 self.logger.info("Successfully read and validated JSON data")
@@ -140,31 +199,31 @@ class AnimeInfoManager:
             True if data is valid, False otherwise
         """
         self.logger.debug("Checking data integrity")
-        
-        required_keys = [
-            'aid', 'year', 'type', 'romaji', 'kanji', 'english', 'synonyms',
-            'episodes', 'ep_count', 'special_count', 'tag_name_list',
-            'tag_id_list', 'tag_weigth_list'
-        ]
 
         try:
-            # Check if all required keys exist
-            missing_keys = [key for key in required_keys if key not in anime_info]
+            # Fast path: one C-level subset check, then a single pass over the values
+            if _REQUIRED_KEY_SET <= anime_info.keys() and all(
+                anime_info[key] is not None and anime_info[key] != '' for key in _REQUIRED_KEYS
+            ):
+                self.logger.debug("Data integrity check passed")
+                return True
+
+            # Classify missing and empty keys in a single pass
+            missing_keys = []
+            empty_keys = []
+            for key in _REQUIRED_KEYS:
+                value = anime_info.get(key, _MISSING)
+                if value is _MISSING:
+                    missing_keys.append(key)
+                elif value is None or value == '':
+                    empty_keys.append(key)
+
             if missing_keys:
                 self.logger.warning(f"Missing required keys: {', '.join(missing_keys)}")
                 return False
 
-            # Check for empty or None values
-            empty_keys = [
-                key for key in required_keys 
-                if anime_info[key] is None or anime_info[key] == ''
-            ]
-            if empty_keys:
-                self.logger.warning(f"Empty values for keys: {', '.join(empty_keys)}")
-                return False
-
-            self.logger.debug("Data integrity check passed")
-            return True
+            self.logger.warning(f"Empty values for keys: {', '.join(empty_keys)}")
+            return False
 
         except Exception as e:
             self.logger.error(f"Error during data integrity check: {str(e)}")
@@ -1,7 +1,24 @@
 import logging
+import logging.handlers
 from pathlib import Path
 from datetime import datetime
 
+
+class _RenderingMemoryHandler(logging.handlers.MemoryHandler):
+    """MemoryHandler that renders each message when it is buffered, not when it is flushed."""
+
+    def emit(self, record):
+        # Lazy %-arguments would otherwise be formatted at flush time, against objects that may have changed
+        try:
+            record.msg = record.getMessage()
+        except Exception:
+            # A bad format call is reported like in any other handler, not raised into the caller
+            self.handleError(record)
+            return
+        record.args = None
+        super().emit(record)
+
+
 class AppLogger:
     def __init__(self, name="LewdWatcher"):
         self.logger = logging.getLogger(name)
@@ -29,20 +46,36 @@ class AppLogger:
         file_handler.setFormatter(formatter)
         console_handler.setFormatter(formatter)
 
-        self.logger.addHandler(file_handler)
+        # Buffer file records and write them in blocks, warnings and errors are written immediately.
+        # The log file can lag the run by up to `capacity` DEBUG/INFO records; they are written
+        # by flush() on close and by logging's exit handler, a hard crash loses them.
+        self._file_buffer = _RenderingMemoryHandler(
+            capacity=128,
+            flushLevel=logging.WARNING,
+            target=file_handler
+        )
+
+        self.logger.addHandler(self._file_buffer)
         self.logger.addHandler(console_handler)
 
-    def debug(self, message):
-        self.logger.debug(message)
+    def flush(self):
+        """Write buffered records to the log file."""
+        self._file_buffer.flush()
+
+    def isEnabledFor(self, level):
+        return self.logger.isEnabledFor(level)
+
+    def debug(self, message, *args):
+        self.logger.debug(message, *args)
 
-    def info(self, message):
-        self.logger.info(message)
+    def info(self, message, *args):
+        self.logger.info(message, *args)
 
-    def warning(self, message):
-        self.logger.warning(message)
+    def warning(self, message, *args):
+        self.logger.warning(message, *args)
 
-    def error(self, message):
-        self.logger.error(message)
+    def error(self, message, *args):
+        self.logger.error(message, *args)
 
-    def critical(self, message):
-        self.logger.critical(message)
+    def critical(self, message, *args):
+        self.logger.critical(message, *args)
@@ -1,7 +1,26 @@
-import xml.etree.ElementTree as ET
+try:
+    # lxml parses with libxml2 in C, the stdlib parser is the fallback
+    from lxml import etree as ET
+    XMLParseError = ET.XMLSyntaxError
+    # NFO files come from scrapers: no entity expansion, no network access, no huge trees
+    _XML_PARSER = ET.XMLParser(resolve_entities=False, no_network=True, huge_tree=False)
+    _ITERPARSE_OPTIONS = {'resolve_entities': False, 'no_network': True}
+    # Compiled once, selects every uniqueid with type="anidb" (case-insensitive)
+    _ANIDB_XPATH = ET.XPath(
+        "//uniqueid[translate(@type, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', "
+        "'abcdefghijklmnopqrstuvwxyz') = 'anidb']"
+    )
+except ImportError:
+    import xml.etree.ElementTree as ET
+    XMLParseError = ET.ParseError
+    _XML_PARSER = None
+    _ITERPARSE_OPTIONS = {}
+    _ANIDB_XPATH = None
+
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional, Tuple
 import os
+import stat
 
 class NFOParser:
     """
@@ -58,62 +77,52 @@ class NFOParser:
             folder_path = Path(folder_path).resolve()
             nfo_path = folder_path / self.nfo_filename
 
-            # Validate path
-            if not folder_path.exists():
-                self.logger.error(f"Folder does not exist: {folder_path}")
-                return None
-
-            if not folder_path.is_dir():
+            # One stat() on the NFO file replaces the separate exists/is_dir/is_file/getsize checks
+            try:
+                nfo_stat = os.stat(nfo_path)
+            except NotADirectoryError:
                 self.logger.error(f"Path is not a directory: {folder_path}")
                 return None
-
-            # Check NFO existence
-            if not nfo_path.exists():
-                self.logger.debug(f"No NFO file found at: {nfo_path}")
+            except FileNotFoundError:
+                # Only on a miss: tell a missing folder apart from a missing NFO file
+                if not os.path.isdir(folder_path):
+                    self.logger.error(f"Folder does not exist: {folder_path}")
+                else:
+                    self.logger.debug(f"No NFO file found at: {nfo_path}")
                 return None
 
-            if not nfo_path.is_file():
+            if not stat.S_ISREG(nfo_stat.st_mode):
                 self.logger.error(f"NFO path exists but is not a file: {nfo_path}")
                 return None
 
             # Check file size
-            file_size = os.path.getsize(nfo_path)
+            file_size = nfo_stat.st_size
             if file_size == 0:
                 self.logger.warning(f"NFO file is empty: {nfo_path}")
                 return None
             self.logger.debug(f"NFO file size: {file_size} bytes")
 
-            # Read and parse XML
+            # Take the first valid AniDB ID
             self.logger.debug("Parsing NFO file")
-            tree = ET.parse(nfo_path)
-            root = tree.getroot()
-
-            # Log root tag for debugging
-            self.logger.debug(f"NFO root element: {root.tag}")
-
-            # Search for AniDB ID
-            for uniqueid in root.findall('.//uniqueid'):
-                id_type = uniqueid.get('type', '').lower()
-                self.logger.debug(f"Found uniqueid element with type: {id_type}")
-
-                if id_type == 'anidb':
-                    anidb_id = uniqueid.text.strip() if uniqueid.text else None
-
-                    if not anidb_id:
-                        self.logger.warning("Found anidb uniqueid element but it's empty")
-                        continue
+            for anidb_id in self._iter_anidb_ids(nfo_path):
+                if not anidb_id:
+                    self.logger.warning("Found anidb uniqueid element but it's empty")
+                    continue
 
-                    if not anidb_id.isdigit():
-                        self.logger.warning(f"Found invalid AniDB ID (non-numeric): {anidb_id}")
-                        continue
+                # Plain ASCII digits only, int() alone also takes '+5', ' 7', '1_000' or other scripts
+                if not (anidb_id.isascii() and anidb_id.isdigit()):
+                    self.logger.warning(f"Found invalid AniDB ID (non-numeric): {anidb_id}")
+                    continue
 
-                    self.logger.info(f"Successfully extracted AniDB ID: {anidb_id}")
-                    return anidb_id
+                # Canonical decimal form, '0042' becomes '42'
+                anidb_id = str(int(anidb_id))
+                self.logger.info(f"Successfully extracted AniDB ID: {anidb_id}")
+                return anidb_id
 
             self.logger.info("No valid AniDB ID found in NFO file")
             return None
 
-        except ET.ParseError as e:
+        except XMLParseError as e:
             self.logger.error(f"XML parsing error in NFO file: {str(e)}")
             self.logger.debug(f"Parse error details - line: {e.position[0]}, column: {e.position[1]}")
             return None
@@ -147,11 +156,11 @@ class NFOParser:
         self.logger.debug(f"Validating NFO file format: {nfo_path}")
 
         try:
-            tree = ET.parse(nfo_path)
+            tree = ET.parse(str(nfo_path), _XML_PARSER)
             root = tree.getroot()
 
-            # Check for basic expected structure
-            has_uniqueid = len(root.findall('.//uniqueid')) > 0
+            # Check for basic expected structure, stops at the first uniqueid
+            has_uniqueid = any(True for _ in root.iter('uniqueid'))
 
             if has_uniqueid:
                 self.logger.debug("NFO file has valid structure with uniqueid elements")
@@ -160,7 +169,7 @@ class NFOParser:
                 self.logger.warning("NFO file is valid XML but missing uniqueid elements")
                 return False
 
-        except ET.ParseError as e:
+        except XMLParseError as e:
             self.logger.error(f"NFO file has invalid XML format: {str(e)}")
             return False
         except Exception as e:
@@ -184,14 +193,8 @@ class NFOParser:
         self.logger.debug(f"Extracting all IDs from NFO file: {nfo_path}")
 
         try:
-            tree = ET.parse(nfo_path)
-            root = tree.getroot()
-
             ids = {}
-            for uniqueid in root.findall('.//uniqueid'):
-                id_type = uniqueid.get('type', '').lower()
-                id_value = uniqueid.text.strip() if uniqueid.text else None
-
+            for id_type, id_value in self._iter_uniqueids(nfo_path):
                 if id_value:
                     ids[id_type] = id_value
                     self.logger.debug(f"Found ID - type: {id_type}, value: {id_value}")
@@ -202,3 +205,49 @@ class NFOParser:
         except Exception as e:
             self.logger.error(f"Error extracting IDs from NFO file: {str(e)}")
             return {}
+
+    @staticmethod
+    def _iter_anidb_ids(nfo_path: Path) -> Iterator[Optional[str]]:
+        """
+        Return the values of the anidb uniqueid elements of an NFO file.
+
+        Parameters
+        ----------
+        nfo_path : Path
+            Path to the NFO file
+
+        Returns
+        -------
+        Iterator[Optional[str]]
+            Stripped text of each uniqueid element with type="anidb", in document order
+        """
+        if _ANIDB_XPATH is not None:
+            # lxml: the compiled XPath selects the elements in C, empty ones give None
+            hits = _ANIDB_XPATH(ET.parse(str(nfo_path), _XML_PARSER))
+            return iter([elem.text.strip() if elem.text else None for elem in hits])
+
+        # Stdlib: stream the XML, the caller stops at the first valid ID
+        return (text for id_type, text in NFOParser._iter_uniqueids(nfo_path) if id_type == 'anidb')
+
+    @staticmethod
+    def _iter_uniqueids(nfo_path: Path) -> Iterator[Tuple[str, Optional[str]]]:
+        """
+        Stream the uniqueid elements of an NFO file without building the whole tree.
+
+        Parameters
+        ----------
+        nfo_path : Path
+            Path to the NFO file
+
+        Yields
+        ------
+        Tuple[str, Optional[str]]
+            Lower-cased type attribute and stripped text of each uniqueid element
+        """
+        with open(nfo_path, 'rb') as nfo_file:
+            for _, elem in ET.iterparse(nfo_file, events=('end',), **_ITERPARSE_OPTIONS):
+                if elem.tag == 'uniqueid':
+                    text = elem.text.strip() if elem.text else None
+                    yield elem.get('type', '').lower(), text
+                # Finished elements are not needed any more
+                elem.clear()
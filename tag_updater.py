@@ -1,68 +1,294 @@
-import requests
-from bs4 import BeautifulSoup
+import asyncio
+import aiohttp
+from bs4 import BeautifulSoup, SoupStrainer
+import importlib.util
 import json
-from PyQt6.QtCore import QObject, pyqtSignal, QTimer
+import logging
+import os
+import re
+import shelve
+import time
+from PyQt6.QtCore import QObject, pyqtSignal
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the stdlib encoder
+    orjson = None
+
+# lxml ist optional, ohne lxml wird der langsamere eingebaute Parser benutzt
+HTML_PARSER = "lxml" if importlib.util.find_spec("lxml") else "html.parser"
+# Nur die Tag-Tabelle aufbauen, der Rest der Seite wird beim Parsen übersprungen
+TAG_TABLE = SoupStrainer("table", class_="taglist")
+# Seitennummern in den Links des Seitenwählers
+PAGE_LINK = re.compile(rb'href="[^"]*[?&;]page=(\d+)')
+# Feste Anfrage-Header und URL der Tag-Liste, einmal beim Import angelegt
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+TAG_PAGE_URL = "https://anidb.net/tag/?noalias=1&orderby.name=0.1&page={}"
 
 class TagListUpdater(QObject):
     finished = pyqtSignal()
     progress = pyqtSignal(int)
 
-    def __init__(self):
+    MAX_CONCURRENT_PAGES = 4    # Seiten, die gleichzeitig geladen werden
+    MIN_REQUEST_INTERVAL = 0.5  # Mindestabstand zwischen zwei Anfragen in Sekunden
+    MAX_REQUEST_INTERVAL = 8.0  # Obergrenze, wenn AniDB mit 429 bremst
+    MAX_RETRIES = 5             # Versuche pro Seite bei Netzwerkfehlern
+    RETRY_BACKOFF = 1.0         # Wartezeit vor dem zweiten Versuch, verdoppelt sich danach
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+    REQUEST_TIMEOUT = 30        # Sekunden pro Anfrage
+    PAGE_CACHE_FILE = "tag_pages.db"  # Zuletzt geladene Seiten für bedingte Anfragen
+    PROGRESS_INTERVAL = 0.2     # Mindestabstand zwischen zwei Fortschrittssignalen in Sekunden
+
+    def __init__(self, logger=None):
         super().__init__()
+        # Ohne übergebenen Logger in das Modul-Log schreiben
+        self.logger = logger or logging.getLogger(__name__)
         self.tags = []
         self.page = 0
+        self._next_request = 0.0
+        self._page_cache = None
+        self._fresh_pages = 0
+        self._request_interval = self.MIN_REQUEST_INTERVAL
+        self._last_emit = 0.0
 
-    def get_tags(self, page):
+    def parse_tags(self, content):
+        """
+        Extract the tags from the HTML of one of AniDB's tag pages.
+
+        Parameters:
+        content (bytes): The HTML of the tag page.
+
+        Returns:
+        list: A list of dictionaries, where each dictionary represents a tag with 'id' and 'name' keys.
+        """
+        soup = BeautifulSoup(content, HTML_PARSER, parse_only=TAG_TABLE)
+
+        tag_list = soup.select("tr.g_odd td.name.main.tag a")
+
+        return [{"id": tag["href"].rsplit("/", 1)[-1], "name": tag.get_text(strip=True)} for tag in tag_list]
+
+    @staticmethod
+    def find_last_page(content):
+        """
+        Read the highest page number from the pager of a tag page.
+
+        Parameters:
+        content (bytes): The HTML of the tag page.
+
+        Returns:
+        int or None: The last page number, or None if the page has no pager links.
+        """
+        pages = [int(number) for number in PAGE_LINK.findall(content)]
+        return max(pages) if pages else None
+
+    async def get_tags(self, session, semaphore, page):
         """
         Fetch a list of tags from AniDB's tag page.
 
         Parameters:
+        session (aiohttp.ClientSession): The session used for the request.
+        semaphore (asyncio.Semaphore): Limits the number of concurrent requests.
         page (int): The page number to fetch tags from.
 
         Returns:
         list: A list of dictionaries, where each dictionary represents a tag with 'id' and 'name' keys.
         """
-        url = f"https://anidb.net/tag/?noalias=1&orderby.name=0.1&page={page}"
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-            "Accept-Language": "en-US,en;q=0.9",
-        }
-        response = requests.get(url, headers=headers)
-        soup = BeautifulSoup(response.content, "html.parser")
+        content = await self.fetch_page(session, semaphore, page)
+        return await self._parse_in_executor(content)
+
+    async def _parse_in_executor(self, content):
+        # Parsen im Thread-Pool, damit der Event-Loop weitere Anfragen abschicken kann
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.parse_tags, content)
+
+    async def fetch_page(self, session, semaphore, page):
+        """
+        Download one of AniDB's tag pages, retrying transient errors.
+
+        Parameters:
+        session (aiohttp.ClientSession): The session used for the request.
+        semaphore (asyncio.Semaphore): Limits the number of concurrent requests.
+        page (int): The page number to fetch.
+
+        Returns:
+        bytes: The HTML of the page.
+        """
+        url = TAG_PAGE_URL.format(page)
+
+        # Bekannte Seiten bedingt anfragen, unveränderte beantwortet AniDB mit 304
+        cached = self._page_cache.get(url) if self._page_cache is not None else None
+        headers = {}
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+        async with semaphore:
+            for attempt in range(self.MAX_RETRIES):
+                await self._wait_for_request_slot()
+                self.logger.debug("Fetching tags from page %s", page)
+                last_attempt = attempt == self.MAX_RETRIES - 1
+                delay = self.RETRY_BACKOFF * 2 ** attempt
+                try:
+                    async with session.get(url, headers=headers) as response:
+                        if response.status == 304 and cached:
+                            content = cached[2]
+                            break
+                        if response.status in self.RETRY_STATUSES and not last_attempt:
+                            delay = max(delay, self._retry_after(response.headers))
+                            if response.status == 429:
+                                # Zu schnell: alle folgenden Anfragen bremsen, nicht nur diese Seite
+                                self._slow_down(delay)
+                            self.logger.warning("Page %s returned %s, retrying in %.1fs", page, response.status, delay)
+                        else:
+                            # Fehlerseiten nicht als leere Seite (Ende der Liste) werten
+                            response.raise_for_status()
+                            content = await response.read()
+                            self._fresh_pages += 1
+                            self._store_page(url, response.headers, content)
+                            break
+                except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                    if last_attempt:
+                        raise
+                    self.logger.warning("Error fetching page %s: %s, retrying", page, e)
+                await asyncio.sleep(delay)
+
+        return content
+
+    def _store_page(self, url, headers, content):
+        # Nur Seiten mit Validator lassen sich später bedingt anfragen
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if self._page_cache is not None and (etag or last_modified):
+            self._page_cache[url] = (etag, last_modified, content)
 
-        tag_list = soup.select("html body#anidb.taglist div#layout-content div#layout-main div.g_content.taglist_all div.g_section.g_datatable.taglist_list div.g_bubblewrap.nowrap table.g_section.taglist tbody tr.g_odd td.name.main.tag a")
-        tags = []
+    @staticmethod
+    def _retry_after(headers):
+        # Retry-After in Sekunden, die HTTP-Datumsform wird ignoriert
+        value = headers.get("Retry-After", "")
+        return int(value) if value.isdigit() else 0
 
-        for tag in tag_list:
-            tag_id = tag["href"].split("/")[-1]
-            tag_name = tag.text.strip()
-            tags.append({"id": tag_id, "name": tag_name})
+    def _slow_down(self, delay):
+        # Abstand zwischen den Anfragen verdoppeln und die nächste Anfrage verschieben
+        self._request_interval = min(self._request_interval * 2, self.MAX_REQUEST_INTERVAL)
+        loop = asyncio.get_running_loop()
+        self._next_request = max(self._next_request, loop.time() + delay)
 
-        return tags
+    async def _wait_for_request_slot(self):
+        # Anfragen zeitversetzt starten, um AniDB nicht zu überlasten
+        async with self._rate_lock:
+            loop = asyncio.get_running_loop()
+            delay = self._next_request - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._next_request = loop.time() + self._request_interval
 
     def update_tags_json(self):
-        # Starte den asynchronen Prozess für das Abrufen der Tags
-        self.fetch_next_page()
+        # Läuft im Worker-Thread, eigener Event-Loop für die Anfragen
+        try:
+            self._fresh_pages = 0
+            self._request_interval = self.MIN_REQUEST_INTERVAL
+            self._last_emit = 0.0
+            with shelve.open(self.PAGE_CACHE_FILE) as page_cache:
+                self._page_cache = page_cache
+                try:
+                    asyncio.run(self.fetch_all_pages())
+                    self._emit_progress(self.page, force=True)  # Endstand immer melden
+                finally:
+                    self._page_cache = None
 
-    def fetch_next_page(self):
-        print(f"Fetching tags from page {self.page}")
-        self.progress.emit(f"Fetching tags from page {self.page}")  # Fortschritt signalisieren
-        page_tags = self.get_tags(self.page)
+            # Nur neu schreiben, wenn sich mindestens eine Seite geändert hat
+            if self._fresh_pages or not os.path.exists("tags.json"):
+                self.save_tags_to_json()
+            else:
+                self.logger.info("Tag list unchanged, keeping tags.json")
+        except Exception as e:
+            # Abgebrochene Liste nicht speichern, die alte tags.json bleibt erhalten
+            self.logger.error("Error updating tag list: %s", e)
+        finally:
+            self.finished.emit()  # Prozess beendet, auch nach einem Fehler
 
+    async def fetch_all_pages(self):
+        self._rate_lock = asyncio.Lock()
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_PAGES)
+
+        # Eine Session mit Keep-Alive-Verbindungen für den ganzen Durchlauf
+        connector = aiohttp.TCPConnector(limit_per_host=self.MAX_CONCURRENT_PAGES)
+        timeout = aiohttp.ClientTimeout(total=self.REQUEST_TIMEOUT)
+
+        async with aiohttp.ClientSession(headers=HEADERS, connector=connector, timeout=timeout) as session:
+            # Die erste Seite enthält den Seitenwähler mit der letzten Seitennummer
+            content = await self.fetch_page(session, semaphore, self.page)
+            if not self._add_page(await self._parse_in_executor(content)):
+                return
+            self._emit_progress(self.page)  # Fortschritt signalisieren
+
+            window = self.MAX_CONCURRENT_PAGES
+            last_page = self.find_last_page(content)
+            if last_page is not None:
+                # Alle bekannten Seiten auf einmal anstoßen, der Semaphor begrenzt die Anzahl
+                pages = range(self.page, last_page + 1)
+                results = await self._fetch_pages(session, semaphore, pages)
+                for page_tags in results:
+                    if not self._add_page(page_tags):
+                        return
+                # Nur noch prüfen, dass nach der letzten Seite nichts mehr kommt
+                window = 1
+
+            while True:
+                pages = range(self.page, self.page + window)
+                results = await self._fetch_pages(session, semaphore, pages)
+
+                for page_tags in results:
+                    if not self._add_page(page_tags):
+                        return
+
+                window = self.MAX_CONCURRENT_PAGES
+
+    def _add_page(self, page_tags):
         if not page_tags:
-            # Keine weiteren Tags, Prozess beenden und Datei schreiben
-            self.save_tags_to_json()
-            self.finished.emit()  # Prozess beendet
-            return
+            # Keine weiteren Tags, alle folgenden Seiten sind ebenfalls leer
+            return False
 
         self.tags.extend(page_tags)
         self.page += 1
+        return True
+
+    async def _fetch_pages(self, session, semaphore, pages):
+        # Seiten gleichzeitig laden, Fortschritt melden, sobald eine Seite fertig ist
+        tasks = [asyncio.ensure_future(self.get_tags(session, semaphore, page)) for page in pages]
+        try:
+            fetched = 0
+            for next_done in asyncio.as_completed(tasks):
+                if await next_done:
+                    fetched += 1
+                    self._emit_progress(self.page + fetched)  # Fortschritt signalisieren
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
 
-        # Füge eine Verzögerung hinzu, bevor die nächste Seite geladen wird
-        QTimer.singleShot(1000, self.fetch_next_page)  # 1 Sekunde warten, dann nächste Seite
+        # Ergebnisse in Seitenreihenfolge, damit tags.json sortiert bleibt
+        return [task.result() for task in tasks]
+
+    def _emit_progress(self, page, force=False):
+        # Signale drosseln, jedes Emit kreuzt die Thread-Grenze und die GUI zeichnet ohnehin nicht schneller
+        now = time.monotonic()
+        if force or now - self._last_emit >= self.PROGRESS_INTERVAL:
+            self.progress.emit(page)
+            self._last_emit = now
 
     def save_tags_to_json(self):
-        # Speichere die Tags in eine JSON-Datei
-        with open("tags.json", "w") as f:
-            json.dump(self.tags, f, indent=4)
-        self.dialog.close()
+        # Speichere die Tags kompakt in eine JSON-Datei (orjson liefert direkt UTF-8 Bytes)
+        if orjson:
+            data = orjson.dumps(self.tags)
+        else:
+            data = json.dumps(self.tags, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+        with open("tags.json", "wb") as f:
+            f.write(data)
@@ -2,9 +2,9 @@
 import sys
 import os
 import asyncio
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from PySide6.QtWidgets import QApplication, QWidget, QFileDialog, QMessageBox
 from PySide6.QtCore import QThread, QTimer, Signal
-from pathlib import Path
 from async_client import AsyncAniDBClient
 from database import AnimeDatabase
 from json_handler import AnimeInfoManager
@@ -21,37 +21,120 @@ from config_manager import ConfigManager
 from ui_form import Ui_Widget
 
 class AnimeProcessingWorker(QThread):
-    anime_processed = Signal(dict)  # Signal für verarbeiteten Anime
+    animes_processed = Signal(list)  # Signal für gesammelt verarbeitete Anime
     error_occurred = Signal(str)    # Signal für Fehler
     processing_finished = Signal(bool)  # Neues Signal mit cancelled Status
 
-    def __init__(self, config, logger, folder_path):
+    DB_BATCH_SIZE = 500  # Anzahl der Einträge pro Datenbank-Transaktion
+    EMIT_INTERVAL = 0.1  # Sekunden, nach denen gesammelte Anime an die GUI gehen
+    EMIT_BATCH_SIZE = 50  # Anzahl der Anime, ab der sofort gesendet wird
+
+    def __init__(self, config, logger, folder_path, aniDB_client=None, anime_folders=None,
+                 tagreader=None, nfo_parser=None):
         super().__init__()
         self.config = config
         self.logger = logger
         self.folder_path = folder_path
+        # Geteilte Helfer des Widgets, fehlende legt der Worker selbst an
+        self.tagreader = tagreader
+        self.nfo_parser = nfo_parser
+        self.anime_folders = anime_folders  # (Name, Pfad) der Unterordner, sonst liest der Worker selbst
+        self.aniDB_client = aniDB_client  # Client der Anwendung, Sitzung bleibt über Läufe erhalten
         self._should_cancel = False
         self._is_running = False
+        self._pending_rows = []
+        self._processed = []    # Noch nicht an die GUI gemeldete Anime
+        self._done = 0          # Fertige Ordner, die GUI liest sie über done_count
+        self._loop = None       # Event-Loop des laufenden Scans
+        self._main_task = None  # Haupt-Coroutine des Scans, Ziel von cancel()
+
+    @property
+    def done_count(self):
+        """Zahl der fertigen Ordner, nur lesend für den Fortschritts-Timer der GUI"""
+        # Ein einzelner int, Lesen aus einem anderen Thread ist unter dem GIL atomar
+        return self._done
+
+    @staticmethod
+    def scan_folders(folder_path):
+        """Liest die Unterordner als (Name, Pfad)-Paare"""
+        # scandir liefert den Typ aus dem Verzeichniseintrag, ohne extra stat() pro Ordner;
+        # is_dir() folgt Symlinks wie das frühere os.path.isdir, verlinkte Anime-Ordner bleiben erhalten
+        with os.scandir(folder_path) as entries:
+            return [(entry.name, entry.path) for entry in entries if entry.is_dir()]
 
     def cancel(self):
-        """Markiert den Worker zum Beenden"""
+        """Markiert den Worker zum Beenden und bricht den laufenden Scan sofort ab"""
         self._should_cancel = True
-        self.logger.info("Cancel requested")  
+        self.logger.info("Cancel requested")
+        # Wird im GUI-Thread aufgerufen, der Abbruch muss im Loop des Workers passieren
+        loop, task = self._loop, self._main_task
+        if loop is not None and task is not None:
+            try:
+                loop.call_soon_threadsafe(task.cancel)
+            except RuntimeError:
+                pass  # Loop ist bereits beendet
+
+    @staticmethod
+    def folder_mtime(full_path):
+        """Änderungszeit des Ordners in Nanosekunden, None wenn er nicht lesbar ist"""
+        try:
+            return os.stat(full_path).st_mtime_ns
+        except OSError:
+            return None
 
-    async def process_single_anime(self, anime_name, full_path, db, aniDB_client, tagreader, nfo_parser):
+    def queue_db_write(self, db, anime_info, full_path):
+        """Puffert einen Datenbankeintrag und schreibt volle Batches"""
+        # Nach dem Schreiben der aniinfo.json lesen, sonst gilt der Ordner beim nächsten Scan als geändert
+        self._pending_rows.append((anime_info, full_path, self.folder_mtime(full_path)))
+        if len(self._pending_rows) >= self.DB_BATCH_SIZE:
+            self.flush_db_writes(db)
+
+    def flush_db_writes(self, db):
+        """Schreibt alle gepufferten Einträge in einer Transaktion"""
+        if self._pending_rows:
+            db.add_anime_many(self._pending_rows)
+            self._pending_rows = []
+
+    def queue_processed(self, anime_info):
+        """Sammelt einen verarbeiteten Anime, volle Pakete gehen sofort an die GUI"""
+        self._processed.append(anime_info)
+        if len(self._processed) >= self.EMIT_BATCH_SIZE:
+            self.flush_processed()
+
+    def flush_processed(self):
+        """Meldet alle gesammelten Anime mit einem einzigen Signal"""
+        if self._processed:
+            self.animes_processed.emit(self._processed)
+            self._processed = []
+
+    async def flush_processed_periodically(self):
+        """Sendet gesammelte Anime alle EMIT_INTERVAL Sekunden"""
+        while True:
+            await asyncio.sleep(self.EMIT_INTERVAL)
+            self.flush_processed()
+
+    def inspect_folder(self, full_path, nfo_parser):
+        """Liest die AniDB-ID aus der NFO und prüft die aniinfo.json, läuft im Thread-Pool"""
+        anidb_id = nfo_parser.check_and_parse_nfo(full_path)
+        hson = AnimeInfoManager(full_path, logger=self.logger)
+        return anidb_id, hson, hson.check_file_existence()
+
+    async def process_single_anime(self, anime_name, full_path, db, aniDB_client, tagreader, nfo_parser,
+                                   known_anime=frozenset()):
         if self._should_cancel:
-            self.logger.info(f"Skipping {anime_name} due to cancel request")
+            self.logger.info("Skipping %s due to cancel request", anime_name)
             return None
         try:
-            self.logger.debug(f"Processing anime: {anime_name}")
+            self.logger.debug("Processing anime: %s", anime_name)
             
-            if not db.anime_exists(anime_name):
-                self.logger.debug(f"Anime {anime_name} not in database, processing...")
-                anidb_id = nfo_parser.check_and_parse_nfo(full_path)
-                hson = AnimeInfoManager(full_path, logger=self.logger)
+            # known_anime stammt aus einer einzigen Abfrage für alle Ordner des Laufs
+            if anime_name not in known_anime:
+                self.logger.debug("Anime %s not in database, processing...", anime_name)
+                # Dateizugriffe im Thread-Pool, der Event-Loop bedient derweil die AniDB-Anfragen
+                anidb_id, hson, has_json = await asyncio.to_thread(self.inspect_folder, full_path, nfo_parser)
                 
                 anime_info = None
-                if not hson.check_file_existence():
+                if not has_json:
                     anime_info = await self.fetch_anime_info(
                         anime_name, 
                         anidb_id, 
@@ -60,8 +143,8 @@ class AnimeProcessingWorker(QThread):
                     
                     if anime_info:
                         anime_info['tag_name_list'] = tagreader.get_names_by_ids(anime_info['tag_id_list'])
-                        hson.create_json(anime_info)
-                        db.add_anime(anime_info, full_path)
+                        await asyncio.to_thread(hson.create_json, anime_info)
+                        self.queue_db_write(db, anime_info, full_path)
                         return anime_info
                 else:
                     return await self.process_existing_json(
@@ -74,7 +157,7 @@ class AnimeProcessingWorker(QThread):
                         tagreader
                     )
             else:
-                self.logger.debug(f"Anime {anime_name} already in database")
+                self.logger.debug("Anime %s already in database", anime_name)
                 return None
                 
         except Exception as e:
@@ -83,11 +166,12 @@ class AnimeProcessingWorker(QThread):
 
     async def fetch_anime_info(self, anime_name: str, anidb_id: str, aniDB_client: AsyncAniDBClient):
         try:
+            # Jede Anfrage wartet nur auf ihre eigene Antwort, Slots und Token-Bucket des Clients takten das Senden
             if anidb_id:
-                self.logger.debug(f"Fetching anime info by ID: {anidb_id}")
+                self.logger.debug("Fetching anime info by ID: %s", anidb_id)
                 return await aniDB_client.query_anime(anidb_id, by_id=True)
             else:
-                self.logger.debug(f"Fetching anime info by name: {anime_name}")
+                self.logger.debug("Fetching anime info by name: %s", anime_name)
                 return await aniDB_client.query_anime(anime_name)
         except Exception as e:
             self.logger.error(f"Error fetching anime info: {str(e)}")
@@ -96,10 +180,11 @@ class AnimeProcessingWorker(QThread):
     async def process_existing_json(self, hson, db, full_path, anime_name, anidb_id, 
                                   aniDB_client, tagreader):
         try:
-            if hson.check_data_integrity():
-                self.logger.debug(f"Reading existing JSON for {anime_name}")
-                anime_info = hson.read_json()
-                db.add_anime(anime_info, full_path)
+            # read_json() prüft die Daten und nutzt den Cache geparster Dateien
+            self.logger.debug("Reading existing JSON for %s", anime_name)
+            anime_info = await asyncio.to_thread(hson.read_json)
+            if anime_info:
+                self.queue_db_write(db, anime_info, full_path)
                 return anime_info
             else:
                 self.logger.warning(f"Corrupted JSON for {anime_name}, refetching")
@@ -110,8 +195,8 @@ class AnimeProcessingWorker(QThread):
                 )
                 if anime_info:
                     anime_info['tag_name_list'] = tagreader.get_names_by_ids(anime_info['tag_id_list'])
-                    hson.create_json(anime_info)
-                    db.add_anime(anime_info, full_path)
+                    await asyncio.to_thread(hson.create_json, anime_info)
+                    self.queue_db_write(db, anime_info, full_path)
                     return anime_info
         except Exception as e:
             self.logger.error(f"Error processing JSON: {str(e)}")
@@ -120,59 +205,126 @@ class AnimeProcessingWorker(QThread):
     def run(self):
         self._is_running = True
         async def main():
+            db = None
+            self._loop = asyncio.get_running_loop()
+            self._main_task = asyncio.current_task()
             try:
                 if self._should_cancel:
                     return
                 
                 db = AnimeDatabase(logger=self.logger)
-                tagreader = TagIDReader(logger=self.logger)
-                nfo_parser = NFOParser(logger=self.logger)
+                tagreader = self.tagreader or TagIDReader(logger=self.logger)
+                nfo_parser = self.nfo_parser or NFOParser(logger=self.logger)
 
                 settings = self.config.get_anidb_settings()
                 if not settings:
                     raise ValueError("No AniDB settings configured")
 
-                async with AsyncAniDBClient(
-                    credentials={'username': settings['username'], 'password': settings['password']},
-                    logger=self.logger,
-                    max_retries=settings['max_retries']
-                ) as aniDB_client:
-                    for anime_name in os.listdir(self.folder_path):
-                        if self._should_cancel:
-                            self.logger.info("Processing cancelled by user")
-                            return
-                        
-                        full_path = os.path.join(self.folder_path, anime_name)
-                        if os.path.isdir(full_path):
-                            anime_info = await self.process_single_anime(
+                aniDB_client = self.aniDB_client
+                shared_client = aniDB_client is not None
+                if not shared_client:
+                    aniDB_client = AsyncAniDBClient(
+                        credentials={'username': settings['username'], 'password': settings['password']},
+                        logger=self.logger,
+                        max_retries=settings['max_retries'],
+                        command_interval=settings['command_interval']
+                    )
+
+                # Einen geteilten Client nicht abmelden, der nächste Lauf spart sich das AUTH
+                async with aniDB_client.session(logout=not shared_client):
+                    # Ordner gleichzeitig verarbeiten, der Semaphor begrenzt die Anzahl
+                    semaphore = asyncio.Semaphore(settings['max_concurrent'])
+
+                    async def process_bounded(anime_name, full_path):
+                        async with semaphore:
+                            return await self.process_single_anime(
                                 anime_name,
                                 full_path,
                                 db,
                                 aniDB_client,
                                 tagreader,
-                                nfo_parser
+                                nfo_parser,
+                                known_anime
                             )
+
+                    anime_folders = self.anime_folders
+                    if anime_folders is None:
+                        anime_folders = self.scan_folders(self.folder_path)
+                    # Vorhandene Anime mit einer Abfrage pro Block statt einer pro Ordner ermitteln
+                    known_anime = db.existing_anime(anime_name for anime_name, _ in anime_folders)
+
+                    # Unveränderte Ordner überspringen, ein stat() statt NFO- und JSON-Lesen
+                    stored_mtimes = db.get_folder_mtimes(full_path for _, full_path in anime_folders)
+                    if stored_mtimes:
+                        changed_folders = []
+                        unlisted_paths = []
+                        for anime_name, full_path in anime_folders:
+                            if stored_mtimes.get(full_path) != self.folder_mtime(full_path):
+                                changed_folders.append((anime_name, full_path))
+                            elif anime_name not in known_anime:
+                                unlisted_paths.append(full_path)
+                        # Übersprungene Ordner zählen für den Fortschrittsbalken als erledigt
+                        self._done = len(anime_folders) - len(changed_folders)
+                        self.logger.info("Skipping %d unchanged folders", self._done)
+                        # Diese Ordner hätte der Scan aus der aniinfo.json angezeigt, stattdessen die gespeicherte Zeile melden
+                        for anime_info in db.get_anime_by_paths(unlisted_paths).values():
+                            self.queue_processed(anime_info)
+                        anime_folders = changed_folders
+                    tasks = [
+                        asyncio.create_task(process_bounded(anime_name, full_path))
+                        for anime_name, full_path in anime_folders
+                    ]
+
+                    # Ergebnisse gesammelt melden, ein Signal pro Paket statt pro Anime
+                    flusher = asyncio.create_task(self.flush_processed_periodically())
+                    try:
+                        # Ergebnisse sammeln, sobald ein Ordner fertig ist
+                        for next_done in asyncio.as_completed(tasks):
+                            anime_info = await next_done
+                            self._done += 1
+                            if self._should_cancel:
+                                self.logger.info("Processing cancelled by user")
+                                return
                             if anime_info:
-                                self.anime_processed.emit(anime_info)
+                                self.queue_processed(anime_info)
+                    finally:
+                        # Offene Aufgaben bei Abbruch oder Fehler beenden, bevor der Client schließt
+                        flusher.cancel()
+                        for task in tasks:
+                            task.cancel()
+                        await asyncio.gather(flusher, *tasks, return_exceptions=True)
 
-                
 
             except Exception as e:
                 self.logger.error(f"Error in processing thread: {str(e)}")
                 self.error_occurred.emit(str(e))
             finally:
+                self._main_task = None
+                self.flush_processed()  # Rest der gesammelten Anime anzeigen
+                # Bereits verarbeitete Einträge auch bei Abbruch speichern
+                if db is not None:
+                    self.flush_db_writes(db)
+                    db.close()
                 self._is_running = False
                 # Emit finished signal before asyncio.run ends
                 self.processing_finished.emit(self._should_cancel)
 
         try:
             asyncio.run(main())
+        except asyncio.CancelledError:
+            # cancel() hat den Scan beendet, processing_finished wurde bereits gesendet
+            self.logger.info("Processing cancelled by user")
         except Exception as e:
             self.logger.error(f"Error in asyncio.run: {str(e)}")
             self._is_running = False
             self.processing_finished.emit(self._should_cancel)
+        finally:
+            self._loop = None
 
 class Widget(QWidget):
+    CLEANUP_WORKERS = 16        # Threads, die beim Aufräumen gleichzeitig löschen
+    CLEANUP_PROGRESS_STEP = 32  # Ordner zwischen zwei Aktualisierungen des Fortschrittsbalkens
+
     def __init__(self, parent=None):
         super().__init__(parent)
         # Initialize logger first
@@ -180,6 +332,16 @@ class Widget(QWidget):
         # Pass logger to ConfigManager
         self.config = ConfigManager(logger=self.logger)
 
+        # AniDB-Client für die gesamte Laufzeit, wird beim ersten Scan angelegt
+        self.aniDB_client = None
+        # Tag-Tabelle und NFO-Parser bleiben zwischen den Läufen bestehen
+        self.tagreader = None
+        self.nfo_parser = None
+        # Fortschritt mit 30 Hz aus dem Zähler des Workers lesen statt bei jedem Anime neu zu zeichnen
+        self.progress_timer = QTimer(self)
+        self.progress_timer.setInterval(33)
+        self.progress_timer.timeout.connect(self.update_progress)
+
         self.ui = Ui_Widget()
         self.ui.setupUi(self)
         self.logger.info("Application started")
@@ -216,14 +378,46 @@ class Widget(QWidget):
         if hasattr(self, 'worker') and self.worker._is_running:
             self.worker.cancel()
             self.worker.wait()  # Warte auf Thread-Beendigung
+        self.end_anidb_session()
+        self.config.flush()  # Geänderte Einstellungen einmalig speichern
+        self.logger.flush()  # Gepufferte Log-Einträge in die Datei schreiben
         event.accept()
 
+    def get_anidb_client(self):
+        """Liefert den geteilten AniDB-Client, bei geänderten Zugangsdaten wird er neu angelegt"""
+        settings = self.config.get_anidb_settings()
+        if not settings:
+            return None
+
+        credentials = {'username': settings['username'], 'password': settings['password']}
+        if self.aniDB_client is None or self.aniDB_client.credentials != credentials:
+            self.end_anidb_session()
+            self.aniDB_client = AsyncAniDBClient(
+                credentials=credentials,
+                logger=self.logger,
+                max_retries=settings['max_retries'],
+                command_interval=settings['command_interval']
+            )
+        return self.aniDB_client
+
+    def end_anidb_session(self):
+        """Meldet die offene AniDB-Sitzung des geteilten Clients ab"""
+        client = self.aniDB_client
+        if client is None or not client.session_key:
+            return
+        try:
+            # Läuft im GUI-Thread: ein einzelnes Datagramm, ohne Event-Loop, Cache und Rate-Limit
+            client.logout_now()
+        except Exception as e:
+            self.logger.error(f"Error ending AniDB session: {str(e)}")
+
     def selectFolder(self):
         try:
             folder_path = QFileDialog.getExistingDirectory(self, "Select Folder")
             if folder_path:
                 self.ui.tPath.setText(folder_path)
                 self.config.set_path('hentaiPath', folder_path)
+                self.config.flush()  # Ordnerwahl sofort sichern, nicht erst beim Beenden
                 self.logger.info(f"Selected folder: {folder_path}")
         except Exception as e:
             self.logger.error(f"Error selecting folder: {str(e)}")
@@ -256,8 +450,9 @@ class Widget(QWidget):
             self.ui.bCancel.setText("Cancel")
             self.ui.progressBar.setVisible(True)
 
-            # Zähle zunächst die Gesamtanzahl der zu verarbeitenden Ordner
-            total_folders = sum(1 for entry in os.scandir(folder_path) if entry.is_dir())
+            # Ordner einmal lesen, die Liste dient dem Fortschrittsbalken und dem Worker
+            anime_folders = AnimeProcessingWorker.scan_folders(folder_path)
+            total_folders = len(anime_folders)
             if total_folders == 0:
                 self.logger.warning("No subdirectories found")
                 self.ui.lOutput.setText("No subdirectories found in selected folder")
@@ -265,28 +460,69 @@ class Widget(QWidget):
                 return
 
             self.ui.progressBar.setMaximum(total_folders)
+
+            if self.tagreader is None:
+                self.tagreader = TagIDReader(logger=self.logger)
+            else:
+                self.tagreader.reload_tags()  # Liest tags.json nur nach einem Tag-Update neu
+            if self.nfo_parser is None:
+                self.nfo_parser = NFOParser(logger=self.logger)
         
             # Create and start worker thread
-            self.worker = AnimeProcessingWorker(self.config, self.logger, folder_path)
-            self.worker.anime_processed.connect(self.on_anime_processed)
+            self.worker = AnimeProcessingWorker(
+                self.config, self.logger, folder_path,
+                aniDB_client=self.get_anidb_client(),
+                anime_folders=anime_folders,
+                tagreader=self.tagreader,
+                nfo_parser=self.nfo_parser
+            )
+            self.worker.animes_processed.connect(self.on_animes_processed)
             self.worker.error_occurred.connect(self.on_error_occurred)
             self.worker.processing_finished.connect(self.on_processing_finished)
+            self.ui.progressBar.setValue(0)
             self.worker.start()
+            self.progress_timer.start()
 
         except Exception as e:
             self.logger.error(f"Error setting up processing: {str(e)}")
             self.ui.lOutput.setText(f"Error: {str(e)}")
             self.setUIEnabled(True)
 
-    def on_anime_processed(self, anime_info):
-        """Handle processed anime information"""
+    def on_animes_processed(self, anime_infos):
+        """Handle a batch of processed anime information"""
         try:
-            self.displayAnimeInfo(anime_info)
-            current_progress = self.ui.progressBar.value() + 1
-            self.ui.progressBar.setValue(current_progress)
+            item_texts = []
+            for anime_info in anime_infos:
+                try:
+                    item_texts.append(self.anime_item_text(anime_info))
+                except Exception as e:
+                    self.logger.error(f"Error displaying anime info: {str(e)}")
+            if not item_texts:
+                return
+
+            # Ein Layout- und Zeichendurchlauf für das ganze Paket, ohne Sortierung und Einzelsignale
+            list_widget = self.ui.listHentai
+            sorting = list_widget.isSortingEnabled()
+            list_widget.setSortingEnabled(False)
+            list_widget.setUpdatesEnabled(False)
+            list_widget.blockSignals(True)
+            try:
+                list_widget.addItems(item_texts)
+            finally:
+                list_widget.blockSignals(False)
+                list_widget.setUpdatesEnabled(True)
+                list_widget.setSortingEnabled(sorting)
+            self.logger.debug("Added %d anime to list", len(item_texts))
         except Exception as e:
             self.logger.error(f"Error handling processed anime: {str(e)}")
 
+    def update_progress(self):
+        """Timer-Slot: übernimmt die Zahl der fertigen Ordner aus dem Worker"""
+        if hasattr(self, 'worker'):
+            done = self.worker.done_count
+            if done != self.ui.progressBar.value():
+                self.ui.progressBar.setValue(done)
+
     def on_error_occurred(self, error_message):
         """Handle processing errors"""
         self.logger.error(f"Processing error: {error_message}")
@@ -296,9 +532,11 @@ class Widget(QWidget):
     def on_processing_finished(self, was_cancelled: bool):
         """Handle completion of processing"""
         try:
+            self.progress_timer.stop()
             if hasattr(self, 'worker'):
                 if self.worker._is_running:
                     self.worker.wait()  # Warte auf Thread-Beendigung
+                self.update_progress()  # Endstand anzeigen
                 self.worker.deleteLater()
                 delattr(self, 'worker')
 
@@ -314,9 +552,14 @@ class Widget(QWidget):
         except Exception as e:
             self.logger.error(f"Error in processing finished handler: {str(e)}")
 
+    @staticmethod
+    def anime_item_text(anime_info):
+        """Listeneintrag für einen Anime"""
+        return f"{anime_info['romaji']} - {anime_info['ep_count']} Episodes"
+
     def displayAnimeInfo(self, anime_info):
         try:
-            item_text = f"{anime_info['romaji']} - {anime_info['ep_count']} Episodes"
+            item_text = self.anime_item_text(anime_info)
             self.ui.listHentai.addItem(item_text)
             self.logger.debug(f"Added anime to list: {item_text}")
         except Exception as e:
@@ -365,6 +608,23 @@ class Widget(QWidget):
         except Exception as e:
             self.logger.error(f"Error reading config path: {str(e)}")
 
+    @staticmethod
+    def remove_anime_json(anime_folder):
+        """
+        Delete the aniinfo.json of one anime folder.
+
+        Returns (folder, json path, removed, error); runs in the cleanup thread pool.
+        """
+        json_path = os.path.join(anime_folder, "aniinfo.json")
+        try:
+            # unlink() alone tells whether the file existed
+            os.unlink(json_path)
+            return anime_folder, json_path, True, None
+        except FileNotFoundError:
+            return anime_folder, json_path, False, None
+        except Exception as e:
+            return anime_folder, json_path, False, e
+
     def clean_up(self):
         """Remove all aniinfo.json files from subdirectories and clean the database."""
         try:
@@ -392,9 +652,10 @@ class Widget(QWidget):
             self.setUIEnabled(False)
             self.ui.progressBar.setVisible(True)
 
-            # Count total subdirectories
-            total_folders = sum(1 for entry in os.scandir(folder_path) if entry.is_dir())
-            self.ui.progressBar.setMaximum(total_folders)
+            # Read the subdirectories once, for the count and the cleanup
+            with os.scandir(folder_path) as entries:
+                anime_folders = [entry.path for entry in entries if entry.is_dir()]
+            self.ui.progressBar.setMaximum(len(anime_folders))
             current_progress = 0
 
             files_removed = 0
@@ -403,31 +664,34 @@ class Widget(QWidget):
 
             # First phase: Remove JSON files
             self.logger.info("Starting JSON files cleanup")
-            for anime_folder in os.scandir(folder_path):
-                if anime_folder.is_dir():
-                    json_path = Path(anime_folder.path) / "aniinfo.json"
-                    try:
-                        if json_path.exists():
-                            json_path.unlink()
-                            files_removed += 1
-                            self.logger.info(f"Removed: {json_path}")
-                        else:
-                            # Keep track of valid anime folders even if they don't have JSON
-                            remaining_valid_paths.append(anime_folder.path)
-                    except Exception as e:
-                        error_msg = f"Error removing {json_path}: {str(e)}"
+            # Each unlink is independent, run them in parallel (slow network shares)
+            with ThreadPoolExecutor(max_workers=self.CLEANUP_WORKERS) as executor:
+                futures = [executor.submit(self.remove_anime_json, anime_folder)
+                           for anime_folder in anime_folders]
+                for future in as_completed(futures):
+                    anime_folder, json_path, removed, error = future.result()
+                    if error is not None:
+                        error_msg = f"Error removing {json_path}: {str(error)}"
                         self.logger.error(error_msg)
                         errors.append(error_msg)
+                    elif removed:
+                        files_removed += 1
+                        self.logger.info(f"Removed: {json_path}")
+                    else:
+                        # Keep track of valid anime folders even if they don't have JSON
+                        remaining_valid_paths.append(anime_folder)
 
                     current_progress += 1
-                    self.ui.progressBar.setValue(current_progress)
-                    QApplication.processEvents()
+                    if (current_progress % self.CLEANUP_PROGRESS_STEP == 0
+                            or current_progress == len(futures)):
+                        self.ui.progressBar.setValue(current_progress)
+                        QApplication.processEvents()
 
             # Second phase: Clean database
             self.logger.info("Starting database cleanup")
             try:
-                db = AnimeDatabase(logger=self.logger)
-                deleted_entries, removed_anime = db.clean_database(remaining_valid_paths)
+                with AnimeDatabase(logger=self.logger) as db:
+                    deleted_entries, removed_anime = db.clean_database(remaining_valid_paths)
 
                 # Clear the anime list widget
                 self.ui.listHentai.clear()